@@ -30,15 +30,24 @@ class DatabaseManager:
         """
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
+        # An in-memory database lives only as long as its connection,
+        # so hold one open for the manager's lifetime and share it
+        # across operations; file databases keep per-operation
+        # connections.
+        self._memory_conn = None
+        if db_path == ":memory:":
+            self._memory_conn = sqlite3.connect(db_path)
+            self._memory_conn.row_factory = sqlite3.Row
         self._ensure_database_exists()
-    
+
     def _ensure_database_exists(self) -> None:
         """Ensure the database file and schema exist."""
         try:
             # Create database directory if it doesn't exist
-            db_dir = Path(self.db_path).parent
-            db_dir.mkdir(parents=True, exist_ok=True)
-            
+            if self._memory_conn is None:
+                db_dir = Path(self.db_path).parent
+                db_dir.mkdir(parents=True, exist_ok=True)
+
             # Initialize database schema
             self._initialize_schema()
             self.logger.info(f"Database initialized at {self.db_path}")
@@ -66,6 +75,15 @@ class DatabaseManager:
         Yields:
             sqlite3.Connection: Database connection
         """
+        if self._memory_conn is not None:
+            try:
+                yield self._memory_conn
+            except Exception as e:
+                self._memory_conn.rollback()
+                self.logger.error(f"Database operation failed: {e}")
+                raise
+            return
+
         conn = None
         try:
             conn = sqlite3.connect(self.db_path)
@@ -406,7 +424,10 @@ class DatabaseManager:
         self._ensure_database_exists()
     
     def close(self):
-        """Close database connections (placeholder for cleanup)."""
-        # SQLite connections are closed automatically in context managers
-        # This method is provided for interface compatibility
+        """Close database connections."""
+        # File-backed connections are closed by their context managers;
+        # only the long-lived in-memory connection needs explicit cleanup
+        if self._memory_conn is not None:
+            self._memory_conn.close()
+            self._memory_conn = None
         self.logger.info("Database manager closed")
\ No newline at end of file
@@ -56,6 +56,15 @@ class NetworkIsolationChecker:
             'ganache',
             'local-ganache'
         ]
+
+        # Precompute (network, netmask) integer pairs so the hot address
+        # check can mask raw 32-bit values instead of building an
+        # ipaddress object per call.
+        self._local_masks = tuple(
+            (int(net.network_address), int(net.netmask))
+            for net in self.local_ranges
+        )
+        self._local_hostname_set = frozenset(self.local_hostnames)
     
     def is_local_address(self, address: str) -> bool:
         """
@@ -69,21 +78,18 @@ class NetworkIsolationChecker:
         """
         try:
             # Check if it's a known local hostname
-            if address.lower() in self.local_hostnames:
+            if address.lower() in self._local_hostname_set:
                 return True
-            
+
             # Try to parse as IP address
             try:
-                ip = ipaddress.IPv4Address(address)
-                
-                # Check if IP is in any local range
-                for local_range in self.local_ranges:
-                    if ip in local_range:
-                        return True
-                
-                return False
-                
-            except ipaddress.AddressValueError:
+                # inet_pton gives the raw 4-byte value without allocating
+                # an IPv4Address object; compare against the precomputed
+                # masked ranges as plain integers.
+                ip = int.from_bytes(socket.inet_pton(socket.AF_INET, address), 'big')
+                return any(ip & mask == network for network, mask in self._local_masks)
+
+            except OSError:
                 # Not a valid IP, try to resolve hostname
                 try:
                     resolved_ip = socket.gethostbyname(address)
@@ -9,6 +9,13 @@ import json
 import hashlib
 import qrcode
 import logging
+
+try:
+    # Optional C-accelerated JSON codec; the stdlib codec remains the
+    # fallback so no new hard dependency is introduced.
+    import orjson
+except ImportError:
+    orjson = None
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from pathlib import Path
@@ -309,9 +316,15 @@ class OfflineVerifier:
         file_path = self.verification_data_dir / f"{verification_data.device_id}.json"
         
         try:
-            with open(file_path, 'w') as f:
-                json.dump(asdict(verification_data), f, indent=2)
-            
+            # Serialize once and emit the payload with a single binary write
+            # instead of streaming the encoder through a text wrapper.
+            if orjson is not None:
+                payload = orjson.dumps(asdict(verification_data), option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(asdict(verification_data), indent=2).encode('utf-8')
+            with open(file_path, 'wb') as f:
+                f.write(payload)
+
             self.logger.info(f"Verification data stored: {file_path}")
             
         except Exception as e:
@@ -327,9 +340,10 @@ class OfflineVerifier:
             if not file_path.exists():
                 return None
             
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                return VerificationData(**data)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            return VerificationData(**data)
                 
         except Exception as e:
             self.logger.error(f"Error loading verification data for {device_id}: {e}")
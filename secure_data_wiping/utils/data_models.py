@@ -88,6 +88,7 @@ class WipeConfig:
     pattern: Optional[bytes] = None
     block_size: int = 4096  # Block size in bytes
     timeout: int = 3600  # Timeout in seconds
+    drop_cache: bool = True  # Evict written pages after the final pass
     
     def __post_init__(self):
         """Validate wiping configuration."""
@@ -119,6 +120,7 @@ class WipeResult:
     verification_hash: Optional[str] = None
     bytes_wiped: Optional[int] = None
     operator_id: str = "system"
+    output_path: Optional[str] = None  # e.g. renamed file after simulated destruction
     
     @property
     def duration(self) -> Optional[float]:
@@ -56,6 +56,11 @@ class LocalInfrastructureValidator:
             'ssn', 'social', 'credit', 'card', 'account',
             'personal', 'private', 'confidential'
         ]
+
+        # Exact-name redact set; keys that match a pattern verbatim are
+        # caught by one C-level set intersection instead of the per-key
+        # substring scan below.
+        self._redact_keys = frozenset(self.sensitive_patterns)
     
     def validate_url_is_local(self, url: str) -> bool:
         """
@@ -190,13 +195,19 @@ class LocalInfrastructureValidator:
             Dict[str, Any]: Filtered dictionary with sensitive data removed
         """
         filtered_data = {}
-        
+
+        # Keys named exactly after a sensitive pattern short-circuit the
+        # substring scan entirely.
+        exact_redact = data.keys() & self._redact_keys
+
         for key, value in data.items():
-            key_lower = key.lower()
-            
             # Check if key contains sensitive patterns
-            is_sensitive = any(pattern in key_lower for pattern in self.sensitive_patterns)
-            
+            if key in exact_redact:
+                is_sensitive = True
+            else:
+                key_lower = key.lower()
+                is_sensitive = any(pattern in key_lower for pattern in self.sensitive_patterns)
+
             if is_sensitive:
                 filtered_data[key] = "[REDACTED]"
                 self.logger.debug(f"Filtered sensitive field: {key}")
@@ -7,9 +7,15 @@ Provides cryptographically verifiable wiping operations for IT asset recycling.
 
 import os
 import time
+import functools
+import json
 import logging
 import hashlib
+import mmap
+import re
 import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
@@ -40,6 +46,53 @@ class VerificationError(WipeEngineError):
     pass
 
 
+# Device-type detection: one compiled alternation scan over the path
+# instead of a chain of substring checks. Longer tokens come before
+# their prefixes so 'ssd' beats 'sd' and 'hdd' beats 'hd' at the same
+# position; when several tokens appear, the leftmost one decides.
+_DEVICE_TOKEN_RE = re.compile(r'ssd|nvme|usb|sd|mmc|hdd|hd')
+
+_DEVICE_TOKEN_TYPES = {
+    'ssd': DeviceType.SSD,
+    'nvme': DeviceType.SSD,
+    'usb': DeviceType.USB,
+    'sd': DeviceType.SD_CARD,
+    'mmc': DeviceType.SD_CARD,
+    'hdd': DeviceType.HDD,
+    'hd': DeviceType.HDD,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_device_path(device_path: str) -> DeviceType:
+    """Device type for a path, memoized per distinct path string."""
+    match = _DEVICE_TOKEN_RE.search(device_path.lower())
+    return _DEVICE_TOKEN_TYPES[match.group()] if match else DeviceType.OTHER
+
+
+@functools.lru_cache(maxsize=8)
+def _expand_pattern(pattern: bytes, block_size: int) -> bytes:
+    """
+    Block-sized expansion of a pass pattern, cached across passes.
+
+    The 0x00/0xFF/DoD patterns recur on every wipe, so their expanded
+    buffers are shared instead of reallocated per pass. Random passes
+    seed a single byte, which keys the cache just as safely; callers
+    treat the returned bytes as immutable.
+    """
+    if len(pattern) == 1:
+        # Single byte pattern - repeat to fill block
+        return pattern * block_size
+    # Multi-byte pattern - repeat as needed
+    return (pattern * ((block_size // len(pattern)) + 1))[:block_size]
+
+
+# Durability barrier for the write path. Only the wiped data matters,
+# not mtime/atime, so fdatasync (which skips the metadata-only journal
+# flush) is preferred where the platform provides it.
+_datasync = getattr(os, 'fdatasync', os.fsync)
+
+
 class WipeEngine:
     """
     Implements NIST 800-88 compliant data wiping procedures.
@@ -86,7 +139,19 @@ class WipeEngine:
             DeviceType.OTHER: 1     # Simulation of physical destruction
         }
     }
-    
+
+    # Blocks batched per writev call; comfortably below IOV_MAX (1024
+    # on Linux) while still collapsing the syscall count per pass.
+    _IOV_BATCH = 64
+
+    # Flattened (method, device_type) -> passes table: every wipe and
+    # pass-count query resolves with one hashed lookup instead of two.
+    _NIST_PASSES = {
+        (method, device_type): passes
+        for method, by_device in NIST_PASS_REQUIREMENTS.items()
+        for device_type, passes in by_device.items()
+    }
+
     def __init__(self, config: Optional[WipeConfig] = None):
         """
         Initialize the wipe engine.
@@ -97,10 +162,12 @@ class WipeEngine:
         self.logger = logging.getLogger(__name__)
         self.default_config = config or WipeConfig(method=WipeMethod.NIST_CLEAR)
         
-        # Statistics tracking
+        # Statistics tracking (lock keeps counters consistent when
+        # batch wipes update them from worker threads)
         self.operations_completed = 0
         self.total_bytes_wiped = 0
         self.last_operation_time = None
+        self._stats_lock = threading.Lock()
         
         self.logger.info("WipeEngine initialized with NIST 800-88 compliance")
     
@@ -134,7 +201,8 @@ class WipeEngine:
                 verify_wipe=wipe_config.verify_wipe,
                 pattern=wipe_config.pattern,
                 block_size=wipe_config.block_size,
-                timeout=wipe_config.timeout
+                timeout=wipe_config.timeout,
+                drop_cache=wipe_config.drop_cache
             )
         
         # Generate operation ID
@@ -169,7 +237,9 @@ class WipeEngine:
             
             # Execute wiping based on method
             if wipe_config.method == WipeMethod.NIST_DESTROY:
-                bytes_wiped = self._simulate_physical_destruction(device_path, device_info)
+                bytes_wiped, wipe_result.output_path = self._simulate_physical_destruction(
+                    device_path, device_info
+                )
                 passes_completed = 1
             else:
                 bytes_wiped, passes_completed = self._execute_overwrite_wipe(
@@ -189,9 +259,10 @@ class WipeEngine:
                 )
             
             # Update statistics
-            self.operations_completed += 1
-            self.total_bytes_wiped += bytes_wiped
-            self.last_operation_time = wipe_result.end_time
+            with self._stats_lock:
+                self.operations_completed += 1
+                self.total_bytes_wiped += bytes_wiped
+                self.last_operation_time = wipe_result.end_time
             
             self.logger.info(f"Wipe operation {operation_id} completed successfully")
             self.logger.info(f"Passes: {passes_completed}, Bytes wiped: {bytes_wiped}")
@@ -212,6 +283,48 @@ class WipeEngine:
             
             raise
     
+    def wipe_devices_batch(self, device_paths: List[str], method: Optional[WipeMethod] = None,
+                           config: Optional[WipeConfig] = None,
+                           max_workers: Optional[int] = None) -> List[WipeResult]:
+        """
+        Wipe multiple devices concurrently.
+
+        Each device runs the standard wipe_device workflow in its own
+        worker thread. Per-device wiping is I/O-bound, so the threads
+        overlap their waits and the batch completes in roughly the time
+        of the slowest device rather than the sum of all of them.
+
+        Args:
+            device_paths: Paths of the devices to wipe
+            method: Wiping method applied to every device
+            config: Wiping configuration (uses default if not provided)
+            max_workers: Worker thread limit (defaults to CPU count)
+
+        Returns:
+            List[WipeResult]: One result per device path, in input order
+        """
+        self.logger.info(f"Starting batch wipe of {len(device_paths)} devices")
+
+        def wipe_one(device_path: str) -> WipeResult:
+            try:
+                return self.wipe_device(device_path, method=method, config=config)
+            except WipeEngineError as e:
+                self.logger.error(f"Batch wipe failed for {device_path}: {e}")
+                failed_method = method or (config or self.default_config).method
+                return WipeResult(
+                    operation_id=str(uuid.uuid4()),
+                    device_id=self._generate_device_id(device_path),
+                    method=failed_method,
+                    passes_completed=0,
+                    start_time=datetime.now(),
+                    end_time=datetime.now(),
+                    success=False,
+                    error_message=str(e)
+                )
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(wipe_one, device_paths))
+
     def verify_wipe(self, device_path: str, wipe_result: WipeResult) -> bool:
         """
         Verify that a wiping operation was successful.
@@ -268,15 +381,19 @@ class WipeEngine:
         Raises:
             DeviceAccessError: If device cannot be accessed
         """
-        if not device_path or not device_path.strip():
+        # Strip once; the stripped result serves both the emptiness
+        # check and all path handling below.
+        device_path = device_path.strip() if device_path else ''
+        if not device_path:
             raise DeviceAccessError("Device path cannot be empty")
-        
+
         # For academic simulation, we'll create a test file if it doesn't exist
         # In production, this would check actual device access
-        device_path = device_path.strip()
         
-        # Simulate device access validation
-        if device_path.startswith('/dev/') or device_path.startswith('\\\\.\\'):
+        # Simulate device access validation. /dev/shm is tmpfs, so
+        # files there are regular files, not devices.
+        if ((device_path.startswith('/dev/') and not device_path.startswith('/dev/shm/'))
+                or device_path.startswith('\\\\.\\')):
             # Simulating real device path - for academic purposes, we'll allow this
             self.logger.info(f"Simulating access to device: {device_path}")
             return
@@ -335,18 +452,7 @@ class WipeEngine:
             DeviceInfo: Detected device information
         """
         # For academic simulation, detect based on path patterns
-        device_path_lower = device_path.lower()
-        
-        if 'ssd' in device_path_lower or 'nvme' in device_path_lower:
-            device_type = DeviceType.SSD
-        elif 'usb' in device_path_lower:
-            device_type = DeviceType.USB
-        elif 'sd' in device_path_lower or 'mmc' in device_path_lower:
-            device_type = DeviceType.SD_CARD
-        elif 'hdd' in device_path_lower or 'hd' in device_path_lower:
-            device_type = DeviceType.HDD
-        else:
-            device_type = DeviceType.OTHER
+        device_type = _classify_device_path(device_path)
         
         # Get file size for capacity
         capacity = None
@@ -367,7 +473,7 @@ class WipeEngine:
     
     def _get_nist_pass_count(self, method: WipeMethod, device_type: DeviceType) -> int:
         """Get NIST-compliant pass count."""
-        return self.NIST_PASS_REQUIREMENTS.get(method, {}).get(device_type, 1)
+        return self._NIST_PASSES.get((method, device_type), 1)
     
     def _execute_overwrite_wipe(self, device_path: str, device_info: DeviceInfo, 
                                config: WipeConfig, required_passes: int) -> Tuple[int, int]:
@@ -391,63 +497,118 @@ class WipeEngine:
         try:
             # Get device size
             device_size = self._get_device_size(device_path)
-            
-            # Execute required number of passes
-            for pass_num in range(required_passes):
-                self.logger.info(f"Starting pass {pass_num + 1}/{required_passes}")
-                
-                # Select pattern for this pass
-                pattern = self._get_wipe_pattern(config.method, device_info.device_type, pass_num)
-                
-                # Perform the overwrite
-                bytes_written = self._overwrite_device(
-                    device_path, pattern, device_size, config.block_size
-                )
-                
-                total_bytes_wiped += bytes_written
-                passes_completed += 1
-                
-                self.logger.info(f"Pass {pass_num + 1} completed: {bytes_written} bytes")
-                
-                # Verify pass if required
-                if config.verify_wipe and pass_num == required_passes - 1:
-                    self._verify_pass(device_path, pattern, device_size)
-            
+
+            # Open the target once for the whole multi-pass run; each
+            # pass rewinds the same descriptor instead of paying an
+            # open/close round-trip per pass.
+            fd, direct = self._open_for_wipe(device_path, device_size, config.block_size)
+
+            try:
+                # Reserve the extents up front so no pass stalls on
+                # mid-write allocation (no-op on already-allocated files).
+                if device_size and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(fd, 0, device_size)
+                    except OSError:
+                        pass  # e.g. filesystem without fallocate support
+
+                # Execute required number of passes
+                for pass_num in range(required_passes):
+                    self.logger.info(f"Starting pass {pass_num + 1}/{required_passes}")
+
+                    # Select pattern for this pass
+                    pattern = self._get_wipe_pattern(config.method, device_info.device_type, pass_num)
+
+                    # Perform the overwrite
+                    try:
+                        bytes_written = self._write_pattern(
+                            fd, pattern, device_size, config.block_size, direct
+                        )
+                    except OSError:
+                        if not direct:
+                            raise
+                        # O_DIRECT was accepted at open time but refused
+                        # on write (e.g. tmpfs); reopen cached and redo
+                        # the pass — the overwrite is idempotent.
+                        self.logger.info("O_DIRECT refused for %s, using cached writes", device_path)
+                        os.close(fd)
+                        fd, direct = os.open(device_path, os.O_WRONLY), False
+                        bytes_written = self._write_pattern(
+                            fd, pattern, device_size, config.block_size, direct
+                        )
+
+                    total_bytes_wiped += bytes_written
+                    passes_completed += 1
+
+                    self.logger.info(f"Pass {pass_num + 1} completed: {bytes_written} bytes")
+
+                    # After each synced pass, evict the pages the wipe
+                    # just wrote: the next pass rewrites them anyway, a
+                    # multi-pass PURGE stops holding pass-count times the
+                    # file size in cache, and final verification reads
+                    # the device instead of the page cache.
+                    if config.drop_cache and hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+                    # Verify pass if required
+                    if config.verify_wipe and pass_num == required_passes - 1:
+                        self._verify_pass(device_path, pattern, device_size)
+            finally:
+                os.close(fd)
+
             return total_bytes_wiped, passes_completed
-            
+
         except Exception as e:
             self.logger.error(f"Overwrite wipe failed at pass {passes_completed + 1}: {e}")
             raise WipeOperationError(f"Overwrite failed: {e}") from e
+
+    def _open_for_wipe(self, device_path: str, device_size: int,
+                       block_size: int) -> Tuple[int, bool]:
+        """
+        Open the wipe target, preferring O_DIRECT when alignment allows.
+
+        Returns:
+            Tuple[int, bool]: (file descriptor, O_DIRECT in effect)
+        """
+        if self._supports_direct_io(device_size, block_size):
+            try:
+                return os.open(device_path, os.O_WRONLY | os.O_DIRECT), True
+            except OSError:
+                self.logger.info("O_DIRECT unavailable for %s, using cached writes", device_path)
+        return os.open(device_path, os.O_WRONLY), False
     
-    def _simulate_physical_destruction(self, device_path: str, device_info: DeviceInfo) -> int:
+    def _simulate_physical_destruction(self, device_path: str,
+                                       device_info: DeviceInfo) -> Tuple[int, Optional[str]]:
         """
         Simulate physical destruction for NIST_DESTROY method.
-        
+
         Args:
             device_path: Path to device
             device_info: Device information
-            
+
         Returns:
-            int: Bytes "destroyed" (for simulation)
+            Tuple[int, Optional[str]]: Bytes "destroyed" and the renamed
+                path of the destroyed file (None if the path was absent)
         """
         self.logger.info("Simulating physical destruction (NIST DESTROY method)")
-        
+
         try:
             # Get device size before "destruction"
             device_size = self._get_device_size(device_path)
-            
+
             # Simulate destruction by making device inaccessible
             # For academic purposes, we'll rename/move the file
+            destroyed_path = None
             if os.path.exists(device_path):
                 destroyed_path = f"{device_path}.DESTROYED_{int(time.time())}"
                 os.rename(device_path, destroyed_path)
                 self.logger.info(f"Device simulated as destroyed: {device_path} -> {destroyed_path}")
-            
+
             # Simulate destruction time based on device size
             destruction_time = min(max(device_size / (1024 * 1024), 1), 10)  # 1-10 seconds
             time.sleep(destruction_time)
-            
-            return device_size
+
+            return device_size, destroyed_path
             
         except Exception as e:
             self.logger.error(f"Physical destruction simulation failed: {e}")
@@ -504,48 +665,118 @@ class WipeEngine:
         Returns:
             int: Number of bytes written
         """
-        bytes_written = 0
-        
         try:
-            with open(device_path, 'r+b') as device:
-                device.seek(0)
-                
-                # Create block-sized pattern
-                if len(pattern) == 1:
-                    # Single byte pattern - repeat to fill block
-                    block_pattern = pattern * block_size
-                else:
-                    # Multi-byte pattern - repeat as needed
-                    block_pattern = (pattern * ((block_size // len(pattern)) + 1))[:block_size]
-                
-                # Write pattern across entire device
-                while bytes_written < device_size:
-                    remaining = device_size - bytes_written
-                    write_size = min(block_size, remaining)
-                    
-                    if write_size < block_size:
-                        # Last partial block
-                        write_data = block_pattern[:write_size]
-                    else:
-                        write_data = block_pattern
-                    
-                    device.write(write_data)
-                    bytes_written += len(write_data)
-                    
-                    # Periodic flush for large devices
-                    if bytes_written % (block_size * 100) == 0:
-                        device.flush()
-                        os.fsync(device.fileno())
-                
-                # Final flush
-                device.flush()
-                os.fsync(device.fileno())
-            
-            return bytes_written
-            
+            fd, direct = self._open_for_wipe(device_path, device_size, block_size)
+            try:
+                return self._write_pattern(fd, pattern, device_size, block_size, direct)
+            finally:
+                os.close(fd)
+
         except Exception as e:
             raise WipeOperationError(f"Device overwrite failed: {e}") from e
-    
+
+    @staticmethod
+    def _supports_direct_io(device_size: int, block_size: int) -> bool:
+        """Check whether O_DIRECT alignment requirements can be met."""
+        return (
+            hasattr(os, 'O_DIRECT')
+            and device_size % mmap.PAGESIZE == 0
+            and block_size % mmap.PAGESIZE == 0
+        )
+
+    def _write_pattern(self, fd: int, pattern: bytes, device_size: int,
+                       block_size: int, direct: bool) -> int:
+        """
+        Write the pattern across an already-open device descriptor.
+
+        The descriptor is rewound first, so the same fd can serve every
+        pass of a multi-pass wipe. Each block goes to the kernel in one
+        write() call, with no buffered-layer copy or flush bookkeeping.
+
+        Args:
+            fd: Open file descriptor for the device
+            pattern: Pattern to write
+            device_size: Size of device in bytes
+            block_size: Block size for writing
+            direct: Descriptor was opened with O_DIRECT
+
+        Returns:
+            int: Number of bytes written
+        """
+        bytes_written = 0
+        use_pwritev = hasattr(os, 'pwritev')
+        if not use_pwritev:
+            os.lseek(fd, 0, os.SEEK_SET)
+
+        # Block-sized pattern, shared across passes via the cache
+        block_pattern = _expand_pattern(pattern, block_size)
+
+        if direct:
+            # O_DIRECT needs a page-aligned user buffer; anonymous
+            # mmap guarantees that where bytes objects do not.
+            aligned = mmap.mmap(-1, block_size)
+            aligned[:] = block_pattern
+            block_pattern = aligned
+
+        # One buffer serves every block; memoryview slices share
+        # it, so partial blocks are written without copying.
+        block_view = memoryview(block_pattern)
+
+        # Devices no larger than one block take a single plain write;
+        # assembling an iovec batch cannot pay for itself at this size.
+        if device_size <= block_size:
+            while bytes_written < device_size:
+                tail = block_view[bytes_written:device_size]
+                if use_pwritev:
+                    bytes_written += os.pwrite(fd, tail, bytes_written)
+                else:
+                    bytes_written += os.write(fd, tail)
+            _datasync(fd)
+            return bytes_written
+
+        unsynced = 0
+        use_writev = hasattr(os, 'writev')
+
+        # Write pattern across entire device. With pwritev/writev, up
+        # to _IOV_BATCH block views go to the kernel per syscall —
+        # scatter-gather batching of what would otherwise be one
+        # write() per block. pwritev carries the file offset in the
+        # call itself, so no lseek is needed between passes and the
+        # descriptor position is never shared state.
+        while bytes_written < device_size:
+            remaining = device_size - bytes_written
+
+            if use_pwritev or use_writev:
+                views = []
+                offset = bytes_written % block_size  # non-zero after a short write
+                if offset:
+                    head = block_view[offset:min(block_size, offset + remaining)]
+                    views.append(head)
+                    remaining -= len(head)
+                while remaining > 0 and len(views) < self._IOV_BATCH:
+                    view = block_view[:min(block_size, remaining)]
+                    views.append(view)
+                    remaining -= len(view)
+                if use_pwritev:
+                    written = os.pwritev(fd, views, bytes_written)
+                else:
+                    written = os.writev(fd, views)
+            else:
+                written = os.write(fd, block_view[:min(block_size, remaining)])
+
+            bytes_written += written
+            unsynced += written
+
+            # Periodic sync for large devices
+            if unsynced >= block_size * 100:
+                _datasync(fd)
+                unsynced = 0
+
+        # Final sync
+        _datasync(fd)
+
+        return bytes_written
+
     def _verify_pass(self, device_path: str, expected_pattern: bytes, device_size: int) -> None:
         """
         Verify that a wiping pass was successful.
@@ -561,21 +792,40 @@ class WipeEngine:
         self.logger.info("Verifying wiping pass")
         
         try:
-            with open(device_path, 'rb') as device:
-                # Sample verification - check multiple points
-                sample_points = min(10, device_size // 1024)  # Up to 10 sample points
-                
+            # Sample verification - check multiple points
+            sample_points = min(10, device_size // 1024)  # Up to 10 sample points
+            if sample_points == 0:
+                self.logger.info("Device too small to sample, skipping pass verification")
+                return
+
+            # Single-byte patterns (all NIST passes) can be checked a
+            # whole window at a time: one C-level equality per sample
+            # point instead of a one-byte probe, so each sample
+            # actually covers a page of the device.
+            if len(expected_pattern) == 1:
+                window_size = min(4096, device_size)
+                expected_window = expected_pattern * window_size
+            else:
+                window_size = len(expected_pattern)
+                expected_window = expected_pattern
+
+            # Map the device read-only and slice the samples out of the
+            # mapping; no seek/read syscall pair per sample point.
+            with open(device_path, 'rb') as device, \
+                    mmap.mmap(device.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_RANDOM'):
+                    mapped.madvise(mmap.MADV_RANDOM)  # sample points are scattered
+
                 for i in range(sample_points):
                     # Calculate sample position
                     position = (device_size * i) // sample_points
-                    device.seek(position)
-                    
+
                     # Read sample
-                    sample_size = min(len(expected_pattern), device_size - position)
-                    sample_data = device.read(sample_size)
-                    
+                    sample_size = min(window_size, device_size - position)
+                    sample_data = mapped[position:position + sample_size]
+
                     # Compare with expected pattern
-                    expected_sample = expected_pattern[:sample_size]
+                    expected_sample = expected_window[:sample_size]
                     if sample_data != expected_sample:
                         raise VerificationError(
                             f"Verification failed at position {position}: "
@@ -596,16 +846,17 @@ class WipeEngine:
             if not os.path.exists(device_path):
                 return False
             
-            # Check if file was modified recently (within operation timeframe)
-            file_mtime = datetime.fromtimestamp(os.path.getmtime(device_path))
-            
+            # Check if file was modified recently (within operation
+            # timeframe); compare raw epoch seconds, no datetime objects
+            file_mtime = os.path.getmtime(device_path)
+
             # Allow some tolerance for file system timestamp precision
             start_time = wipe_result.start_time
             end_time = wipe_result.end_time or datetime.now()
-            
+
             # Check if modification time is within the operation window (with 1 second tolerance)
             time_tolerance = 1.0  # 1 second tolerance
-            if (start_time.timestamp() - time_tolerance) <= file_mtime.timestamp() <= (end_time.timestamp() + time_tolerance):
+            if (start_time.timestamp() - time_tolerance) <= file_mtime <= (end_time.timestamp() + time_tolerance):
                 return True
             
             # Also check if the file size matches what we expect
@@ -649,7 +900,7 @@ class WipeEngine:
         }
         
         # Generate hash
-        verification_json = json.dumps(verification_data, sort_keys=True)
+        verification_json = json.dumps(verification_data, sort_keys=True, separators=(',', ':'))
         return hashlib.sha256(verification_json.encode()).hexdigest()
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -665,8 +916,4 @@ class WipeEngine:
             'last_operation_time': self.last_operation_time.isoformat() if self.last_operation_time else None,
             'nist_methods_supported': [method.value for method in WipeMethod],
             'device_types_supported': [device_type.value for device_type in DeviceType]
-        }
-
-
-# Import json for verification hash generation
-import json
\ No newline at end of file
+        }
\ No newline at end of file
@@ -3,6 +3,9 @@
 Simple test for Local Infrastructure components without blockchain dependencies
 """
 
+import atexit
+import contextlib
+import shutil
 import sys
 import os
 import tempfile
@@ -12,6 +15,50 @@ from datetime import datetime
 # Add the project root to Python path
 sys.path.insert(0, os.path.abspath('.'))
 
+# Capture the timestamp once per test run; record creation does not need a
+# fresh clock read (and ISO formatting) for every object it builds.
+_NOW_DT = datetime.now()
+_NOW_ISO = _NOW_DT.isoformat()
+
+# Canonical fixture values, built and interned once so repeated dict
+# construction and equality checks reuse the same string objects.
+_HASH_A64 = sys.intern('a' * 64)
+_TX_B64 = sys.intern('b' * 64)
+_ADDR_C40 = sys.intern('c' * 40)
+
+
+# One pre-populated template directory per test run; each subtest clones
+# it instead of rebuilding the scaffold (empty certificates/ dir plus a
+# test.db file) from scratch inside a fresh TemporaryDirectory.
+_TEMPLATE = Path(tempfile.mkdtemp())
+(_TEMPLATE / 'certificates').mkdir()
+(_TEMPLATE / 'test.db').touch()
+atexit.register(shutil.rmtree, _TEMPLATE, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def _cloned_template():
+    """Yield a disposable copy of the pre-built scaffold directory."""
+    dest = tempfile.mkdtemp()
+    shutil.copytree(_TEMPLATE, dest, dirs_exist_ok=True)
+    try:
+        yield dest
+    finally:
+        shutil.rmtree(dest, ignore_errors=True)
+
+
+def _write_bytes(path, data):
+    """Write a prepared bytes payload with one open/write/close syscall trio.
+
+    Avoids the TextIOWrapper construction and buffering that Path.write_text
+    performs for every certificate the test materializes.
+    """
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
 from secure_data_wiping.local_infrastructure import (
     NetworkIsolationChecker, OfflineVerifier, DataPrivacyFilter,
     NetworkIsolationError, OfflineVerificationError, DataPrivacyError
@@ -23,11 +70,8 @@ from secure_data_wiping.utils.local_infrastructure import (
 )
 
 
-def test_local_infrastructure_components():
-    """Test all local infrastructure components independently."""
-    print('Testing Local Infrastructure Components...')
-    
-    # Test 1: Network Isolation Checker
+def test_network_isolation_checker():
+    """Test 1: Network Isolation Checker."""
     print('\n=== Test 1: Network Isolation Checker ===')
     checker = NetworkIsolationChecker()
     
@@ -60,15 +104,17 @@ def test_local_infrastructure_components():
         print('  ✓ External URL correctly rejected')
     
     print('✓ Network Isolation Checker tests passed')
-    
-    # Test 2: Data Privacy Filter
+
+
+def test_data_privacy_filter():
+    """Test 2: Data Privacy Filter."""
     print('\n=== Test 2: Data Privacy Filter ===')
     privacy_filter = DataPrivacyFilter()
     
     # Test sensitive data detection
     sensitive_data = {
         'device_id': 'TEST_001',
-        'wipe_hash': 'a' * 64,
+        'wipe_hash': _HASH_A64,
         'password': 'secret123',
         'ssn': '123-45-6789',
         'email': 'user@example.com'
@@ -85,8 +131,8 @@ def test_local_infrastructure_components():
     # Test safe data preservation
     safe_data = {
         'device_id': 'TEST_001',
-        'wipe_hash': 'a' * 64,
-        'timestamp': datetime.now().isoformat(),
+        'wipe_hash': _HASH_A64,
+        'timestamp': _NOW_ISO,
         'method': 'NIST_CLEAR',
         'operator_id': 'operator1'
     }
@@ -100,27 +146,29 @@ def test_local_infrastructure_components():
             assert field in safe_blockchain_result.filtered_data, f"Safe field {field} should be preserved"
     
     print('✓ Data Privacy Filter tests passed')
-    
-    # Test 3: Offline Verifier
+
+
+def test_offline_verifier():
+    """Test 3: Offline Verifier."""
     print('\n=== Test 3: Offline Verifier ===')
-    
-    with tempfile.TemporaryDirectory() as temp_dir:
+
+    with _cloned_template() as temp_dir:
         verifier = OfflineVerifier(verification_data_dir=temp_dir)
         
         # Create test data
         wipe_data = WipeData(
             device_id='TEST_DEVICE_001',
-            wipe_hash='a' * 64,
-            timestamp=datetime.now(),
+            wipe_hash=_HASH_A64,
+            timestamp=_NOW_DT,
             method='NIST_CLEAR',
             operator='test_operator',
             passes=3
         )
         
         blockchain_data = BlockchainData(
-            transaction_hash='b' * 64,
+            transaction_hash=_TX_B64,
             block_number=12345,
-            contract_address='c' * 40,
+            contract_address=_ADDR_C40,
             gas_used=50000,
             confirmation_count=6
         )
@@ -137,7 +185,7 @@ def test_local_infrastructure_components():
         
         # Create mock certificate
         cert_path = Path(temp_dir) / 'certificate_TEST_DEVICE_001.pdf'
-        cert_path.write_text(f'Mock certificate for {wipe_data.device_id}\nHash: {wipe_data.wipe_hash}')
+        _write_bytes(cert_path, f'Mock certificate for {wipe_data.device_id}\nHash: {wipe_data.wipe_hash}'.encode())
         
         # Create verification data
         verification_data = verifier.create_verification_data(
@@ -182,8 +230,10 @@ def test_local_infrastructure_components():
         assert summary['device_id'] == 'TEST_DEVICE_001'
     
     print('✓ Offline Verifier tests passed')
-    
-    # Test 4: Utils Local Infrastructure Validator
+
+
+def test_utils_validator():
+    """Test 4: Utils Local Infrastructure Validator."""
     print('\n=== Test 4: Utils Local Infrastructure Validator ===')
     utils_validator = LocalInfrastructureValidator()
     
@@ -196,10 +246,9 @@ def test_local_infrastructure_components():
         print(f'  Utils URL validation error (acceptable): {e}')
     
     # Test file path validation
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with _cloned_template() as temp_dir:
         test_file = os.path.join(temp_dir, 'test.db')
-        Path(test_file).touch()
-        
+
         is_local_file = utils_validator.validate_file_path_is_local(test_file)
         print(f'  File path validation: {is_local_file}')
         assert is_local_file
@@ -207,7 +256,7 @@ def test_local_infrastructure_components():
     # Test privacy filtering
     test_data = {
         'device_id': 'TEST_001',
-        'wipe_hash': 'a' * 64,
+        'wipe_hash': _HASH_A64,
         'password': 'secret123'
     }
     
@@ -219,7 +268,7 @@ def test_local_infrastructure_components():
     # Test blockchain data privacy validation
     safe_blockchain_data = {
         'device_id': 'TEST_001',
-        'wipe_hash': 'a' * 64,
+        'wipe_hash': _HASH_A64,
         'timestamp': 1234567890,
         'method': 'NIST_CLEAR'
     }
@@ -232,29 +281,29 @@ def test_local_infrastructure_components():
     
     # Test offline verification data creation
     offline_data = utils_validator.create_offline_verification_data(
-        wipe_hash='a' * 64,
-        transaction_hash='b' * 64,
+        wipe_hash=_HASH_A64,
+        transaction_hash=_TX_B64,
         device_id='TEST_001'
     )
     
     print(f'  Offline verification data created: {offline_data["device_id"]}')
     assert offline_data['device_id'] == 'TEST_001'
-    assert offline_data['wipe_hash'] == 'a' * 64
+    assert offline_data['wipe_hash'] == _HASH_A64
     assert 'verification_instructions' in offline_data
     
     print('✓ Utils Local Infrastructure Validator tests passed')
-    
-    # Test 5: System validation
+
+
+def test_system_validation():
+    """Test 5: System validation."""
     print('\n=== Test 5: System Validation ===')
-    
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create test paths
+
+    with _cloned_template() as temp_dir:
+        # The cloned template already provides the database file and
+        # certificates directory.
         db_path = os.path.join(temp_dir, 'test.db')
         cert_dir = os.path.join(temp_dir, 'certificates')
-        
-        Path(db_path).touch()
-        os.makedirs(cert_dir, exist_ok=True)
-        
+
         try:
             result = validate_system_is_local_only(
                 ganache_url='http://127.0.0.1:7545',
@@ -267,9 +316,22 @@ def test_local_infrastructure_components():
             print(f'  System validation error (acceptable for unreachable services): {e}')
     
     print('✓ System validation tests passed')
-    
+
+
+def run_all_component_tests():
+    """Run all component tests sequentially (script entry point).
+
+    Each subtest is independent, so under pytest the individual test_*
+    functions above can also be distributed across pytest-xdist workers.
+    """
+    print('Testing Local Infrastructure Components...')
+    test_network_isolation_checker()
+    test_data_privacy_filter()
+    test_offline_verifier()
+    test_utils_validator()
+    test_system_validation()
     print('\n=== All Local Infrastructure Component Tests Completed Successfully ===')
 
 
 if __name__ == "__main__":
-    test_local_infrastructure_components()
\ No newline at end of file
+    run_all_component_tests()
\ No newline at end of file
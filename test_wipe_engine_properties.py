@@ -7,21 +7,136 @@ Feature: secure-data-wiping-blockchain
 Property 1: NIST Compliance for Wiping Operations
 """
 
+import functools
+import itertools
+import string
 import sys
 import os
 import tempfile
 import shutil
-from datetime import datetime
-from hypothesis import given, strategies as st, settings, assume
-from hypothesis.stateful import RuleBasedStateMachine, rule, initialize, invariant
+
+import pytest
+# The @given decorators run at collection, so hypothesis itself cannot be
+# deferred — but the unused stateful submodule (and its import cost) can go.
+from hypothesis import HealthCheck, given, strategies as st, settings
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from secure_data_wiping.wipe_engine import WipeEngine, WipeEngineError
+# Profile-driven example counts: CI runs the full budget, the dev loop a
+# handful of examples. Deadlines are disabled in both because a real
+# multi-pass wipe legitimately exceeds Hypothesis's 200ms default.
+settings.register_profile(
+    "ci", max_examples=50, deadline=None,
+    suppress_health_check=[HealthCheck.too_slow]
+)
+settings.register_profile("dev", max_examples=5, deadline=None)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
+
+from secure_data_wiping.wipe_engine import WipeEngine
 from secure_data_wiping.utils.data_models import WipeMethod, WipeConfig, DeviceInfo, DeviceType
 
 
+# Expected NIST pass counts as a flat table: CLEAR and DESTROY are one
+# pass everywhere, PURGE is one pass on SSD/NVMe (crypto erase) and three
+# elsewhere. One dict lookup replaces the per-example if/elif chains.
+_EXPECTED_PASSES = {
+    **{(WipeMethod.NIST_CLEAR, dt): 1 for dt in DeviceType},
+    **{(WipeMethod.NIST_DESTROY, dt): 1 for dt in DeviceType},
+    **{(WipeMethod.NIST_PURGE, dt):
+       1 if dt in (DeviceType.SSD, DeviceType.NVME) else 3
+       for dt in DeviceType},
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _nist_passes(method, device_type):
+    """Memoized NIST pass counts.
+
+    There are only 3 methods x 6 device types, but the property tests ask
+    for the expected count on every Hypothesis example; the cache turns
+    the repeat lookups into dict hits.
+    """
+    return WipeEngine().get_nist_pass_count(method, device_type)
+
+
+# Preallocated file payload; every generated test file is at most 1 KB,
+# so one shared buffer replaces a fresh b'X' * size allocation per example.
+# Writes go through a memoryview so partial sizes never copy the buffer.
+_PAYLOAD_1K = b'X' * 1024
+_PAYLOAD_VIEW = memoryview(_PAYLOAD_1K)
+
+# Monotonic name sequence for generated test files; avoids
+# NamedTemporaryFile's random-name lock and open-file bookkeeping.
+_FILE_SEQ = itertools.count()
+
+# Per-check progress chatter from the manual runners is opt-in; without
+# VERBOSE set, only the end-of-run summaries are printed.
+_VERBOSE = bool(os.environ.get("VERBOSE"))
+
+
+def _vprint(message):
+    if _VERBOSE:
+        print(message)
+
+
+def _writable_tmp_base():
+    """Prefer tmpfs (/dev/shm) so per-example file churn never hits disk."""
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return tempfile.gettempdir()
+
+
+def _create_test_file(dir_path, size_bytes=1024):
+    """Create a test file with a single open/write/close syscall trio."""
+    path = os.path.join(dir_path, f"wipe_{next(_FILE_SEQ)}.img")
+    fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, _PAYLOAD_VIEW[:size_bytes])
+    finally:
+        os.close(fd)
+    return path
+
+
+@pytest.fixture(scope="class")
+def engine():
+    """One WipeEngine shared by the whole property-test class.
+
+    The engine is stateless between wipes, so constructing it once
+    removes a per-test setup step that Hypothesis would otherwise
+    multiply across examples.
+    """
+    return WipeEngine()
+
+
+@pytest.fixture(scope="class")
+def wipe_dir():
+    """One backing directory shared by every example in the class.
+
+    Hypothesis drives each property test through dozens of examples; a
+    single tmpfs-backed directory, cleaned once at class teardown,
+    replaces the per-test mkdtemp/rmtree churn. Files removed by
+    NIST_DESTROY simply stop existing; everything else is swept by the
+    final rmtree.
+    """
+    path = tempfile.mkdtemp(prefix=f"wipe_props_{os.getpid()}_",
+                            dir=_writable_tmp_base())
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope="class")
+def template_file(wipe_dir):
+    """A premade 512-byte file that examples hard-link instead of rewriting.
+
+    os.link is a single metadata syscall with no data copy; the tests
+    only assert on wipe results, never on file contents, so sharing the
+    inode between links is harmless.
+    """
+    return _create_test_file(wipe_dir, 512)
+
+
 # Strategy for generating device types
 device_type_strategy = st.sampled_from([
     DeviceType.HDD,
@@ -39,11 +154,15 @@ wipe_method_strategy = st.sampled_from([
     WipeMethod.NIST_DESTROY
 ])
 
+# The engine treats device IDs as opaque, so a flat ASCII alphabet
+# generates them without per-codepoint Unicode category lookups.
+_DEVICE_ID_ALPHABET = string.ascii_letters + string.digits + "_"
+
 # Strategy for generating device info
 @st.composite
 def device_info_strategy(draw):
     """Generate valid DeviceInfo objects."""
-    device_id = draw(st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pc'))))
+    device_id = draw(st.text(min_size=4, max_size=16, alphabet=st.sampled_from(_DEVICE_ID_ALPHABET)))
     device_type = draw(device_type_strategy)
     manufacturer = draw(st.one_of(st.none(), st.text(min_size=1, max_size=30)))
     model = draw(st.one_of(st.none(), st.text(min_size=1, max_size=30)))
@@ -76,43 +195,19 @@ def wipe_config_strategy(draw):
     )
 
 
+@pytest.mark.property
 class TestWipeEngineProperties:
-    """Property-based tests for WipeEngine."""
-    
-    def setup_method(self):
-        """Set up test environment."""
-        self.engine = WipeEngine()
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_files = []
-    
-    def teardown_method(self):
-        """Clean up test environment."""
-        # Clean up test files
-        for file_path in self.test_files:
-            if os.path.exists(file_path):
-                try:
-                    os.unlink(file_path)
-                except OSError:
-                    pass
-        
-        # Clean up temp directory
-        if os.path.exists(self.temp_dir):
-            try:
-                shutil.rmtree(self.temp_dir)
-            except OSError:
-                pass
-    
-    def create_test_file(self, size_bytes=1024):
-        """Create a temporary test file."""
-        temp_file = tempfile.NamedTemporaryFile(dir=self.temp_dir, delete=False)
-        temp_file.write(b'X' * size_bytes)
-        temp_file.close()
-        self.test_files.append(temp_file.name)
-        return temp_file.name
-    
+    """Property-based tests for WipeEngine.
+
+    The engine and test-file directory come from class-scoped fixtures;
+    there is no per-test setup or teardown to run for each Hypothesis
+    example. Every test is independent (the backing directory is
+    per-process), so the class can be sharded with pytest -n auto.
+    """
+
     @given(device_info=device_info_strategy(), wipe_method=wipe_method_strategy)
-    @settings(max_examples=50, deadline=30000)  # 30 second deadline per test
-    def test_property_1_nist_compliance_for_wiping_operations(self, device_info, wipe_method):
+    @settings(derandomize=True)
+    def test_property_1_nist_compliance_for_wiping_operations(self, engine, wipe_dir, device_info, wipe_method):
         """
         Property 1: NIST Compliance for Wiping Operations
         
@@ -123,13 +218,13 @@ class TestWipeEngineProperties:
         Validates: Requirements 1.1, 1.2, 1.5
         """
         # Create test file
-        test_file = self.create_test_file(1024)  # 1KB test file
+        test_file = _create_test_file(wipe_dir, 1024)  # 1KB test file
         
         # Get expected NIST pass count
-        expected_passes = self.engine.get_nist_pass_count(wipe_method, device_info.device_type)
+        expected_passes = _nist_passes(wipe_method, device_info.device_type)
         
         # Perform wipe operation
-        result = self.engine.wipe_device(
+        result = engine.wipe_device(
             device_path=test_file,
             method=wipe_method,
             device_info=device_info
@@ -144,63 +239,53 @@ class TestWipeEngineProperties:
         assert result.end_time is not None, f"End time should be recorded"
         assert result.bytes_wiped > 0, f"Should report bytes wiped"
         
-        # Verify NIST-specific requirements
-        if wipe_method == WipeMethod.NIST_CLEAR:
-            # CLEAR method should use exactly 1 pass for all device types
-            assert result.passes_completed == 1, f"NIST CLEAR should use exactly 1 pass, got {result.passes_completed}"
-        
-        elif wipe_method == WipeMethod.NIST_PURGE:
-            # PURGE method pass count depends on device type
-            if device_info.device_type in [DeviceType.SSD, DeviceType.NVME]:
-                # SSDs and NVMe should use 1 pass (cryptographic erase simulation)
-                assert result.passes_completed == 1, f"NIST PURGE on SSD/NVMe should use 1 pass (crypto erase), got {result.passes_completed}"
-            else:
-                # HDDs and other devices should use 3 passes
-                assert result.passes_completed == 3, f"NIST PURGE on {device_info.device_type.value} should use 3 passes, got {result.passes_completed}"
-        
-        elif wipe_method == WipeMethod.NIST_DESTROY:
-            # DESTROY method should use 1 pass (physical destruction simulation)
-            assert result.passes_completed == 1, f"NIST DESTROY should use 1 pass (destruction), got {result.passes_completed}"
+        # Verify NIST-specific requirements against the flat expected table
+        nist_expected = _EXPECTED_PASSES[(wipe_method, device_info.device_type)]
+        assert result.passes_completed == nist_expected, \
+            f"{wipe_method.value} on {device_info.device_type.value} should use {nist_expected} passes, got {result.passes_completed}"
+
+        if wipe_method == WipeMethod.NIST_DESTROY:
             # For DESTROY, original file should no longer exist
             assert not os.path.exists(test_file), f"Original file should be destroyed"
     
-    @given(device_type=device_type_strategy, wipe_method=wipe_method_strategy)
-    @settings(max_examples=30)
+    @pytest.mark.parametrize(
+        "device_type,wipe_method",
+        list(itertools.product(
+            DeviceType,
+            [WipeMethod.NIST_CLEAR, WipeMethod.NIST_PURGE, WipeMethod.NIST_DESTROY]
+        ))
+    )
     def test_nist_pass_count_consistency(self, device_type, wipe_method):
         """
         Test that NIST pass count requirements are consistent and follow standards.
+
+        The input space is a finite 6 x 3 product, so every combination is
+        checked exhaustively and deterministically rather than sampled
+        through Hypothesis.
         """
-        pass_count = self.engine.get_nist_pass_count(wipe_method, device_type)
-        
+        pass_count = _nist_passes(wipe_method, device_type)
+
         # All methods should require at least 1 pass
         assert pass_count >= 1, f"All methods should require at least 1 pass"
-        
-        # CLEAR should always be 1 pass
-        if wipe_method == WipeMethod.NIST_CLEAR:
-            assert pass_count == 1, f"NIST CLEAR should always be 1 pass"
-        
-        # DESTROY should always be 1 pass (physical destruction)
-        elif wipe_method == WipeMethod.NIST_DESTROY:
-            assert pass_count == 1, f"NIST DESTROY should always be 1 pass"
-        
-        # PURGE should follow device-specific requirements
-        elif wipe_method == WipeMethod.NIST_PURGE:
-            if device_type in [DeviceType.SSD, DeviceType.NVME]:
-                assert pass_count == 1, f"PURGE on SSD/NVMe should be 1 pass (crypto erase)"
-            else:
-                assert pass_count == 3, f"PURGE on {device_type.value} should be 3 passes"
+
+        # Every combination must match the NIST expected table
+        assert pass_count == _EXPECTED_PASSES[(wipe_method, device_type)], \
+            f"{wipe_method.value} on {device_type.value} should be " \
+            f"{_EXPECTED_PASSES[(wipe_method, device_type)]} passes"
     
     @given(device_info=device_info_strategy())
-    @settings(max_examples=20)
-    def test_all_methods_supported_for_all_devices(self, device_info):
+    @settings(derandomize=True)
+    def test_all_methods_supported_for_all_devices(self, engine, wipe_dir, template_file, device_info):
         """
         Test that all NIST methods are supported for all device types.
         """
-        test_file = self.create_test_file(512)  # Small test file
+        # One link() syscall per example instead of rewriting the payload
+        test_file = os.path.join(wipe_dir, f"case_{next(_FILE_SEQ)}.img")
+        os.link(template_file, test_file)
         
         for method in [WipeMethod.NIST_CLEAR, WipeMethod.NIST_PURGE, WipeMethod.NIST_DESTROY]:
             # Each method should work with each device type
-            result = self.engine.wipe_device(
+            result = engine.wipe_device(
                 device_path=test_file,
                 method=method,
                 device_info=device_info
@@ -211,18 +296,19 @@ class TestWipeEngineProperties:
             
             # Recreate test file for next method (DESTROY removes it)
             if method == WipeMethod.NIST_DESTROY:
-                test_file = self.create_test_file(512)
+                test_file = os.path.join(wipe_dir, f"case_{next(_FILE_SEQ)}.img")
+                os.link(template_file, test_file)
     
     @given(wipe_config=wipe_config_strategy(), device_info=device_info_strategy())
-    @settings(max_examples=20)
-    def test_configuration_override_behavior(self, wipe_config, device_info):
+    @settings(derandomize=True)
+    def test_configuration_override_behavior(self, engine, wipe_dir, wipe_config, device_info):
         """
         Test that wipe configuration properly overrides default settings.
         """
-        test_file = self.create_test_file(1024)
+        test_file = _create_test_file(wipe_dir, 1024)
         
         # Perform wipe with specific config
-        result = self.engine.wipe_device(
+        result = engine.wipe_device(
             device_path=test_file,
             device_info=device_info,
             config=wipe_config
@@ -233,21 +319,21 @@ class TestWipeEngineProperties:
         assert result.method == wipe_config.method, f"Should use configured method"
         
         # Pass count should follow NIST requirements, not config.passes
-        expected_passes = self.engine.get_nist_pass_count(wipe_config.method, device_info.device_type)
+        expected_passes = _nist_passes(wipe_config.method, device_info.device_type)
         assert result.passes_completed == expected_passes, f"Should follow NIST requirements regardless of config.passes"
     
     @given(device_info=device_info_strategy())
-    @settings(max_examples=15)
-    def test_verification_hash_generation(self, device_info):
+    @settings(derandomize=True)
+    def test_verification_hash_generation(self, engine, wipe_dir, device_info):
         """
         Test that verification hashes are generated when verification is enabled.
         """
-        test_file = self.create_test_file(1024)
+        test_file = _create_test_file(wipe_dir, 1024)
         
         # Create config with verification enabled
         config = WipeConfig(method=WipeMethod.NIST_CLEAR, verify_wipe=True)
         
-        result = self.engine.wipe_device(
+        result = engine.wipe_device(
             device_path=test_file,
             device_info=device_info,
             config=config
@@ -258,10 +344,10 @@ class TestWipeEngineProperties:
         assert len(result.verification_hash) == 64, f"SHA-256 hash should be 64 hex characters"
         
         # Test without verification
-        test_file2 = self.create_test_file(1024)
+        test_file2 = _create_test_file(wipe_dir, 1024)
         config_no_verify = WipeConfig(method=WipeMethod.NIST_CLEAR, verify_wipe=False)
         
-        result2 = self.engine.wipe_device(
+        result2 = engine.wipe_device(
             device_path=test_file2,
             device_info=device_info,
             config=config_no_verify
@@ -275,56 +361,55 @@ def test_property_1_examples():
     """
     Test Property 1 with specific examples to ensure correctness.
     """
-    print("Testing Property 1: NIST Compliance with specific examples...")
+    _vprint("Testing Property 1: NIST Compliance with specific examples...")
     
     engine = WipeEngine()
-    temp_dir = tempfile.mkdtemp()
-    
+    temp_dir = tempfile.mkdtemp(dir=_writable_tmp_base())
+
+    # All four fixture files are written up front from the shared
+    # preallocated payload, one raw write each, instead of a fresh
+    # b'...' * 100 allocation per file.
+    test_file1, test_file2, test_file3, test_file4 = (
+        os.path.join(temp_dir, name)
+        for name in ("test_hdd.img", "test_ssd.img",
+                     "test_usb.img", "test_destroy.img")
+    )
+    for path in (test_file1, test_file2, test_file3, test_file4):
+        fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, _PAYLOAD_VIEW)
+        finally:
+            os.close(fd)
+
     try:
         # Test Case 1: HDD with CLEAR method
-        test_file1 = os.path.join(temp_dir, "test_hdd.img")
-        with open(test_file1, 'wb') as f:
-            f.write(b'TEST_DATA' * 100)
-        
         hdd_info = DeviceInfo(device_id="HDD_001", device_type=DeviceType.HDD)
         result1 = engine.wipe_device(test_file1, WipeMethod.NIST_CLEAR, hdd_info)
         
         assert result1.success is True
         assert result1.passes_completed == 1  # CLEAR = 1 pass
         assert result1.method == WipeMethod.NIST_CLEAR
-        print("✓ HDD CLEAR: 1 pass as expected")
+        _vprint("✓ HDD CLEAR: 1 pass as expected")
         
         # Test Case 2: SSD with PURGE method
-        test_file2 = os.path.join(temp_dir, "test_ssd.img")
-        with open(test_file2, 'wb') as f:
-            f.write(b'SSD_DATA' * 100)
-        
         ssd_info = DeviceInfo(device_id="SSD_001", device_type=DeviceType.SSD)
         result2 = engine.wipe_device(test_file2, WipeMethod.NIST_PURGE, ssd_info)
         
         assert result2.success is True
         assert result2.passes_completed == 1  # SSD PURGE = 1 pass (crypto erase)
         assert result2.method == WipeMethod.NIST_PURGE
-        print("✓ SSD PURGE: 1 pass (crypto erase) as expected")
+        _vprint("✓ SSD PURGE: 1 pass (crypto erase) as expected")
         
         # Test Case 3: USB with PURGE method
-        test_file3 = os.path.join(temp_dir, "test_usb.img")
-        with open(test_file3, 'wb') as f:
-            f.write(b'USB_DATA' * 100)
-        
         usb_info = DeviceInfo(device_id="USB_001", device_type=DeviceType.USB)
         result3 = engine.wipe_device(test_file3, WipeMethod.NIST_PURGE, usb_info)
         
         assert result3.success is True
         assert result3.passes_completed == 3  # USB PURGE = 3 passes
         assert result3.method == WipeMethod.NIST_PURGE
-        print("✓ USB PURGE: 3 passes as expected")
+        _vprint("✓ USB PURGE: 3 passes as expected")
         
         # Test Case 4: Any device with DESTROY method
-        test_file4 = os.path.join(temp_dir, "test_destroy.img")
-        with open(test_file4, 'wb') as f:
-            f.write(b'DESTROY_DATA' * 100)
-        
         destroy_info = DeviceInfo(device_id="DESTROY_001", device_type=DeviceType.HDD)
         result4 = engine.wipe_device(test_file4, WipeMethod.NIST_DESTROY, destroy_info)
         
@@ -332,7 +417,7 @@ def test_property_1_examples():
         assert result4.passes_completed == 1  # DESTROY = 1 pass (physical destruction)
         assert result4.method == WipeMethod.NIST_DESTROY
         assert not os.path.exists(test_file4)  # File should be destroyed
-        print("✓ DESTROY: 1 pass and file destroyed as expected")
+        _vprint("✓ DESTROY: 1 pass and file destroyed as expected")
         
         print("✓ Property 1 specific examples all passed")
         
@@ -343,10 +428,11 @@ def test_property_1_examples():
 
 def run_manual_property_tests():
     """Run manual property tests without hypothesis decorators."""
-    print("Running manual property tests...")
-    
-    test_instance = TestWipeEngineProperties()
+    _vprint("Running manual property tests...")
     
+    engine = WipeEngine()
+    manual_dir = tempfile.mkdtemp(dir=_writable_tmp_base())
+
     # Test with specific known values
     test_cases = [
         (DeviceInfo(device_id="TEST_HDD", device_type=DeviceType.HDD), WipeMethod.NIST_CLEAR),
@@ -355,19 +441,18 @@ def run_manual_property_tests():
         (DeviceInfo(device_id="TEST_DESTROY", device_type=DeviceType.HDD), WipeMethod.NIST_DESTROY),
     ]
     
-    for i, (device_info, wipe_method) in enumerate(test_cases):
-        print(f"Testing case {i+1}: {device_info.device_type.value} with {wipe_method.value}")
-        
-        test_instance.setup_method()
-        try:
+    try:
+        for i, (device_info, wipe_method) in enumerate(test_cases):
+            _vprint(f"Testing case {i+1}: {device_info.device_type.value} with {wipe_method.value}")
+
             # Manual implementation of the property test logic
-            test_file = test_instance.create_test_file(1024)
-            
+            test_file = _create_test_file(manual_dir, 1024)
+
             # Get expected NIST pass count
-            expected_passes = test_instance.engine.get_nist_pass_count(wipe_method, device_info.device_type)
+            expected_passes = _nist_passes(wipe_method, device_info.device_type)
             
             # Perform wipe operation
-            result = test_instance.engine.wipe_device(
+            result = engine.wipe_device(
                 device_path=test_file,
                 method=wipe_method,
                 device_info=device_info
@@ -382,23 +467,18 @@ def run_manual_property_tests():
             assert result.end_time is not None, f"End time should be recorded"
             assert result.bytes_wiped > 0, f"Should report bytes wiped"
             
-            # Verify NIST-specific requirements
-            if wipe_method == WipeMethod.NIST_CLEAR:
-                assert result.passes_completed == 1, f"NIST CLEAR should use exactly 1 pass"
-            elif wipe_method == WipeMethod.NIST_PURGE:
-                if device_info.device_type in [DeviceType.SSD, DeviceType.NVME]:
-                    assert result.passes_completed == 1, f"NIST PURGE on SSD/NVMe should use 1 pass"
-                else:
-                    assert result.passes_completed == 3, f"NIST PURGE on {device_info.device_type.value} should use 3 passes"
-            elif wipe_method == WipeMethod.NIST_DESTROY:
-                assert result.passes_completed == 1, f"NIST DESTROY should use 1 pass"
+            # Verify NIST-specific requirements against the flat expected table
+            nist_expected = _EXPECTED_PASSES[(wipe_method, device_info.device_type)]
+            assert result.passes_completed == nist_expected, \
+                f"{wipe_method.value} on {device_info.device_type.value} should use {nist_expected} passes"
+            if wipe_method == WipeMethod.NIST_DESTROY:
                 assert not os.path.exists(test_file), f"Original file should be destroyed"
             
-            print(f"✓ Case {i+1} passed: {result.passes_completed} passes, {result.bytes_wiped} bytes")
-            
-        finally:
-            test_instance.teardown_method()
-    
+            _vprint(f"✓ Case {i+1} passed: {result.passes_completed} passes, {result.bytes_wiped} bytes")
+
+    finally:
+        shutil.rmtree(manual_dir, ignore_errors=True)
+
     print("✓ All manual property test cases passed")
 
 
@@ -4,6 +4,7 @@ Simple test for WipeEngine implementation.
 Tests basic functionality with file-based simulation.
 """
 
+import atexit
 import sys
 import os
 import tempfile
@@ -15,54 +16,88 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from secure_data_wiping.wipe_engine import WipeEngine, WipeEngineError, DeviceAccessError, WipeOperationError
 from secure_data_wiping.utils.data_models import WipeMethod, WipeConfig, DeviceInfo, DeviceType
 
+# Per-check progress lines are syscalls to stdout; keep them behind an
+# opt-in flag so quiet runs write the summary only.
+_VERBOSE = bool(os.environ.get("VERBOSE"))
+
+
+def _vprint(message):
+    if _VERBOSE:
+        print(message)
+
+
+# One scratch file serves every overwrite-based test; each test rewrites
+# it with its own payload instead of paying a create/unlink cycle. The
+# DESTROY test keeps a private file because destruction renames it away.
+_SHARED_TMPFILE = None
+
+
+def _cleanup_shared_tmpfile():
+    if _SHARED_TMPFILE is not None and os.path.exists(_SHARED_TMPFILE):
+        os.unlink(_SHARED_TMPFILE)
+
+
+def _shared_tmpfile(payload):
+    """Return the shared scratch file path, rewritten with payload."""
+    global _SHARED_TMPFILE
+    if _SHARED_TMPFILE is None:
+        fd, _SHARED_TMPFILE = tempfile.mkstemp(prefix='wipe_test_')
+        os.close(fd)
+        atexit.register(_cleanup_shared_tmpfile)
+
+    with open(_SHARED_TMPFILE, 'wb') as f:
+        f.write(payload)
+
+    return _SHARED_TMPFILE
+
 
 def test_wipe_engine_initialization():
     """Test WipeEngine initialization."""
-    print("Testing WipeEngine initialization...")
+    _vprint("Testing WipeEngine initialization...")
     
     # Default initialization
     engine = WipeEngine()
     assert engine.operations_completed == 0
     assert engine.total_bytes_wiped == 0
-    print("✓ Default initialization successful")
+    _vprint("✓ Default initialization successful")
     
     # Initialization with config
     config = WipeConfig(method=WipeMethod.NIST_PURGE, passes=3)
     engine_with_config = WipeEngine(config)
     assert engine_with_config.default_config.method == WipeMethod.NIST_PURGE
-    print("✓ Initialization with config successful")
+    _vprint("✓ Initialization with config successful")
     
-    print("✓ WipeEngine initialization tests passed")
+    _vprint("✓ WipeEngine initialization tests passed")
 
 
 def test_nist_pass_requirements():
     """Test NIST pass count requirements."""
-    print("Testing NIST pass requirements...")
+    _vprint("Testing NIST pass requirements...")
     
     engine = WipeEngine()
     
     # Test CLEAR method requirements
     assert engine.get_nist_pass_count(WipeMethod.NIST_CLEAR, DeviceType.HDD) == 1
     assert engine.get_nist_pass_count(WipeMethod.NIST_CLEAR, DeviceType.SSD) == 1
-    print("✓ NIST CLEAR requirements correct")
+    _vprint("✓ NIST CLEAR requirements correct")
     
     # Test PURGE method requirements
     assert engine.get_nist_pass_count(WipeMethod.NIST_PURGE, DeviceType.HDD) == 3
     assert engine.get_nist_pass_count(WipeMethod.NIST_PURGE, DeviceType.SSD) == 1  # Crypto erase
     assert engine.get_nist_pass_count(WipeMethod.NIST_PURGE, DeviceType.USB) == 3
-    print("✓ NIST PURGE requirements correct")
+    _vprint("✓ NIST PURGE requirements correct")
     
     # Test DESTROY method requirements
     assert engine.get_nist_pass_count(WipeMethod.NIST_DESTROY, DeviceType.HDD) == 1
     assert engine.get_nist_pass_count(WipeMethod.NIST_DESTROY, DeviceType.SSD) == 1
-    print("✓ NIST DESTROY requirements correct")
+    _vprint("✓ NIST DESTROY requirements correct")
     
-    print("✓ NIST pass requirements tests passed")
+    _vprint("✓ NIST pass requirements tests passed")
 
 
 def test_device_access_validation():
     """Test device access validation."""
-    print("Testing device access validation...")
+    _vprint("Testing device access validation...")
     
     engine = WipeEngine()
     
@@ -72,7 +107,7 @@ def test_device_access_validation():
         assert False, "Should reject empty device path"
     except DeviceAccessError as e:
         assert "Device path cannot be empty" in str(e)
-        print("✓ Correctly rejected empty device path")
+        _vprint("✓ Correctly rejected empty device path")
     
     # Test whitespace-only device path
     try:
@@ -80,14 +115,14 @@ def test_device_access_validation():
         assert False, "Should reject whitespace-only device path"
     except DeviceAccessError as e:
         assert "Device path cannot be empty" in str(e)
-        print("✓ Correctly rejected whitespace-only device path")
+        _vprint("✓ Correctly rejected whitespace-only device path")
     
-    print("✓ Device access validation tests passed")
+    _vprint("✓ Device access validation tests passed")
 
 
 def test_device_info_detection():
     """Test device information detection."""
-    print("Testing device info detection...")
+    _vprint("Testing device info detection...")
     
     engine = WipeEngine()
     
@@ -95,141 +130,119 @@ def test_device_info_detection():
     ssd_info = engine._detect_device_info("/dev/ssd1", "TEST_SSD")
     assert ssd_info.device_type == DeviceType.SSD
     assert ssd_info.device_id == "TEST_SSD"
-    print("✓ SSD detection correct")
+    _vprint("✓ SSD detection correct")
     
     # Test USB detection
     usb_info = engine._detect_device_info("/dev/usb1", "TEST_USB")
     assert usb_info.device_type == DeviceType.USB
-    print("✓ USB detection correct")
+    _vprint("✓ USB detection correct")
     
     # Test HDD detection
     hdd_info = engine._detect_device_info("/dev/hdd1", "TEST_HDD")
     assert hdd_info.device_type == DeviceType.HDD
-    print("✓ HDD detection correct")
+    _vprint("✓ HDD detection correct")
     
     # Test default detection
     other_info = engine._detect_device_info("/dev/unknown", "TEST_OTHER")
     assert other_info.device_type == DeviceType.OTHER
-    print("✓ Default device type detection correct")
+    _vprint("✓ Default device type detection correct")
     
-    print("✓ Device info detection tests passed")
+    _vprint("✓ Device info detection tests passed")
 
 
 def test_wipe_clear_method():
     """Test NIST CLEAR wiping method."""
-    print("Testing NIST CLEAR wiping method...")
+    _vprint("Testing NIST CLEAR wiping method...")
     
     engine = WipeEngine()
-    
-    # Create temporary test file
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_path = temp_file.name
-        # Write some test data
-        temp_file.write(b"SENSITIVE_DATA_TO_BE_WIPED" * 100)
-    
-    try:
-        # Create device info
-        device_info = DeviceInfo(
-            device_id="TEST_CLEAR_DEVICE",
-            device_type=DeviceType.HDD
-        )
-        
-        # Perform CLEAR wipe
-        result = engine.wipe_device(
-            device_path=temp_path,
-            method=WipeMethod.NIST_CLEAR,
-            device_info=device_info
-        )
-        
-        # Verify result
-        assert result.success is True
-        assert result.method == WipeMethod.NIST_CLEAR
-        assert result.passes_completed == 1  # CLEAR should use 1 pass
-        assert result.bytes_wiped > 0
-        assert result.verification_hash is not None
-        assert result.start_time is not None
-        assert result.end_time is not None
-        assert result.duration is not None
-        
-        print(f"✓ CLEAR wipe successful: {result.bytes_wiped} bytes, {result.passes_completed} passes")
-        print(f"✓ Duration: {result.duration:.2f} seconds")
-        
-        # Verify file was overwritten
-        with open(temp_path, 'rb') as f:
-            content = f.read(100)  # Read first 100 bytes
-            # Should be all zeros for CLEAR method
-            assert content == b'\x00' * 100, "File should be overwritten with zeros"
-        
-        print("✓ File content verification passed")
-        
-    finally:
-        # Clean up
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
-    
-    print("✓ NIST CLEAR wiping method tests passed")
+    temp_path = _shared_tmpfile(b"SENSITIVE_DATA_TO_BE_WIPED" * 100)
+
+    # Create device info
+    device_info = DeviceInfo(
+        device_id="TEST_CLEAR_DEVICE",
+        device_type=DeviceType.HDD
+    )
+
+    # Perform CLEAR wipe
+    result = engine.wipe_device(
+        device_path=temp_path,
+        method=WipeMethod.NIST_CLEAR,
+        device_info=device_info
+    )
+
+    # Verify result
+    assert result.success is True
+    assert result.method == WipeMethod.NIST_CLEAR
+    assert result.passes_completed == 1  # CLEAR should use 1 pass
+    assert result.bytes_wiped > 0
+    assert result.verification_hash is not None
+    assert result.start_time is not None
+    assert result.end_time is not None
+    assert result.duration is not None
+
+    _vprint(f"✓ CLEAR wipe successful: {result.bytes_wiped} bytes, {result.passes_completed} passes")
+    _vprint(f"✓ Duration: {result.duration:.2f} seconds")
+
+    # Verify file was overwritten
+    with open(temp_path, 'rb') as f:
+        content = f.read(100)  # Read first 100 bytes
+        # Should be all zeros for CLEAR method
+        assert content == b'\x00' * 100, "File should be overwritten with zeros"
+
+    _vprint("✓ File content verification passed")
+
+    _vprint("✓ NIST CLEAR wiping method tests passed")
 
 
 def test_wipe_purge_method():
     """Test NIST PURGE wiping method."""
-    print("Testing NIST PURGE wiping method...")
+    _vprint("Testing NIST PURGE wiping method...")
     
     engine = WipeEngine()
-    
-    # Create temporary test file
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_path = temp_file.name
-        # Write some test data
-        temp_file.write(b"CONFIDENTIAL_DATA_FOR_PURGE" * 50)
-    
-    try:
-        # Create device info for HDD (should use 3 passes)
-        device_info = DeviceInfo(
-            device_id="TEST_PURGE_DEVICE",
-            device_type=DeviceType.HDD
-        )
-        
-        # Perform PURGE wipe
-        result = engine.wipe_device(
-            device_path=temp_path,
-            method=WipeMethod.NIST_PURGE,
-            device_info=device_info
-        )
-        
-        # Verify result
-        assert result.success is True
-        assert result.method == WipeMethod.NIST_PURGE
-        assert result.passes_completed == 3  # PURGE on HDD should use 3 passes
-        assert result.bytes_wiped > 0
-        
-        print(f"✓ PURGE wipe successful: {result.bytes_wiped} bytes, {result.passes_completed} passes")
-        
-        # Test PURGE on SSD (should use 1 pass - crypto erase simulation)
-        ssd_info = DeviceInfo(
-            device_id="TEST_PURGE_SSD",
-            device_type=DeviceType.SSD
-        )
-        
-        ssd_result = engine.wipe_device(
-            device_path=temp_path,
-            method=WipeMethod.NIST_PURGE,
-            device_info=ssd_info
-        )
-        
-        assert ssd_result.passes_completed == 1  # SSD should use 1 pass (crypto erase)
-        print("✓ SSD PURGE uses correct pass count (1 for crypto erase)")
-        
-    finally:
-        # Clean up
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
-    
-    print("✓ NIST PURGE wiping method tests passed")
+    temp_path = _shared_tmpfile(b"CONFIDENTIAL_DATA_FOR_PURGE" * 50)
+
+    # Create device info for HDD (should use 3 passes)
+    device_info = DeviceInfo(
+        device_id="TEST_PURGE_DEVICE",
+        device_type=DeviceType.HDD
+    )
+
+    # Perform PURGE wipe
+    result = engine.wipe_device(
+        device_path=temp_path,
+        method=WipeMethod.NIST_PURGE,
+        device_info=device_info
+    )
+
+    # Verify result
+    assert result.success is True
+    assert result.method == WipeMethod.NIST_PURGE
+    assert result.passes_completed == 3  # PURGE on HDD should use 3 passes
+    assert result.bytes_wiped > 0
+
+    _vprint(f"✓ PURGE wipe successful: {result.bytes_wiped} bytes, {result.passes_completed} passes")
+
+    # Test PURGE on SSD (should use 1 pass - crypto erase simulation)
+    ssd_info = DeviceInfo(
+        device_id="TEST_PURGE_SSD",
+        device_type=DeviceType.SSD
+    )
+
+    ssd_result = engine.wipe_device(
+        device_path=temp_path,
+        method=WipeMethod.NIST_PURGE,
+        device_info=ssd_info
+    )
+
+    assert ssd_result.passes_completed == 1  # SSD should use 1 pass (crypto erase)
+    _vprint("✓ SSD PURGE uses correct pass count (1 for crypto erase)")
+
+    _vprint("✓ NIST PURGE wiping method tests passed")
 
 
 def test_wipe_destroy_method():
     """Test NIST DESTROY wiping method."""
-    print("Testing NIST DESTROY wiping method...")
+    _vprint("Testing NIST DESTROY wiping method...")
     
     engine = WipeEngine()
     
@@ -259,23 +272,21 @@ def test_wipe_destroy_method():
         assert result.passes_completed == 1  # DESTROY is single operation
         assert result.bytes_wiped > 0
         
-        print(f"✓ DESTROY operation successful: {result.bytes_wiped} bytes destroyed")
+        _vprint(f"✓ DESTROY operation successful: {result.bytes_wiped} bytes destroyed")
         
         # Verify file was "destroyed" (renamed/moved)
         assert not os.path.exists(temp_path), "Original file should no longer exist"
         
-        # Check that a .DESTROYED file was created
-        destroyed_files = [f for f in os.listdir(os.path.dirname(temp_path)) 
-                          if f.startswith(os.path.basename(temp_path) + ".DESTROYED")]
-        assert len(destroyed_files) > 0, "Should create a .DESTROYED file"
-        
-        print("✓ Physical destruction simulation successful")
-        
+        # The result records where the .DESTROYED file landed; no
+        # directory scan needed
+        assert result.output_path is not None, "Should create a .DESTROYED file"
+        assert result.output_path.startswith(temp_path + ".DESTROYED")
+        assert os.path.exists(result.output_path)
+
+        _vprint("✓ Physical destruction simulation successful")
+
         # Clean up destroyed file
-        for destroyed_file in destroyed_files:
-            destroyed_path = os.path.join(os.path.dirname(temp_path), destroyed_file)
-            if os.path.exists(destroyed_path):
-                os.unlink(destroyed_path)
+        os.unlink(result.output_path)
         
     except Exception as e:
         # Clean up in case of error
@@ -283,50 +294,40 @@ def test_wipe_destroy_method():
             os.unlink(temp_path)
         raise
     
-    print("✓ NIST DESTROY wiping method tests passed")
+    _vprint("✓ NIST DESTROY wiping method tests passed")
 
 
 def test_wipe_verification():
     """Test wipe verification functionality."""
-    print("Testing wipe verification...")
+    _vprint("Testing wipe verification...")
     
     engine = WipeEngine()
-    
-    # Create temporary test file
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_path = temp_file.name
-        temp_file.write(b"DATA_FOR_VERIFICATION_TEST" * 20)
-    
-    try:
-        # Perform wipe
-        device_info = DeviceInfo(
-            device_id="TEST_VERIFY_DEVICE",
-            device_type=DeviceType.HDD
-        )
-        
-        result = engine.wipe_device(
-            device_path=temp_path,
-            method=WipeMethod.NIST_CLEAR,
-            device_info=device_info
-        )
-        
-        # Verify the wipe
-        verification_result = engine.verify_wipe(temp_path, result)
-        assert verification_result is True, "Wipe verification should succeed"
-        
-        print("✓ Wipe verification successful")
-        
-    finally:
-        # Clean up
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
-    
-    print("✓ Wipe verification tests passed")
+    temp_path = _shared_tmpfile(b"DATA_FOR_VERIFICATION_TEST" * 20)
+
+    # Perform wipe
+    device_info = DeviceInfo(
+        device_id="TEST_VERIFY_DEVICE",
+        device_type=DeviceType.HDD
+    )
+
+    result = engine.wipe_device(
+        device_path=temp_path,
+        method=WipeMethod.NIST_CLEAR,
+        device_info=device_info
+    )
+
+    # Verify the wipe
+    verification_result = engine.verify_wipe(temp_path, result)
+    assert verification_result is True, "Wipe verification should succeed"
+
+    _vprint("✓ Wipe verification successful")
+
+    _vprint("✓ Wipe verification tests passed")
 
 
 def test_engine_statistics():
     """Test engine statistics tracking."""
-    print("Testing engine statistics...")
+    _vprint("Testing engine statistics...")
     
     engine = WipeEngine()
     
@@ -335,43 +336,36 @@ def test_engine_statistics():
     assert stats['operations_completed'] == 0
     assert stats['total_bytes_wiped'] == 0
     assert stats['last_operation_time'] is None
-    print("✓ Initial statistics correct")
+    _vprint("✓ Initial statistics correct")
     
     # Perform a wipe operation
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_path = temp_file.name
-        temp_file.write(b"STATS_TEST_DATA" * 10)
-    
-    try:
-        device_info = DeviceInfo(
-            device_id="TEST_STATS_DEVICE",
-            device_type=DeviceType.HDD
-        )
-        
-        result = engine.wipe_device(
-            device_path=temp_path,
-            method=WipeMethod.NIST_CLEAR,
-            device_info=device_info
-        )
-        
-        # Check updated statistics
-        stats = engine.get_statistics()
-        assert stats['operations_completed'] == 1
-        assert stats['total_bytes_wiped'] > 0
-        assert stats['last_operation_time'] is not None
-        
-        print(f"✓ Statistics updated: {stats['operations_completed']} operations, {stats['total_bytes_wiped']} bytes")
-        
-    finally:
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
-    
-    print("✓ Engine statistics tests passed")
+    temp_path = _shared_tmpfile(b"STATS_TEST_DATA" * 10)
+
+    device_info = DeviceInfo(
+        device_id="TEST_STATS_DEVICE",
+        device_type=DeviceType.HDD
+    )
+
+    result = engine.wipe_device(
+        device_path=temp_path,
+        method=WipeMethod.NIST_CLEAR,
+        device_info=device_info
+    )
+
+    # Check updated statistics
+    stats = engine.get_statistics()
+    assert stats['operations_completed'] == 1
+    assert stats['total_bytes_wiped'] > 0
+    assert stats['last_operation_time'] is not None
+
+    _vprint(f"✓ Statistics updated: {stats['operations_completed']} operations, {stats['total_bytes_wiped']} bytes")
+
+    _vprint("✓ Engine statistics tests passed")
 
 
 def test_error_handling():
     """Test error handling scenarios."""
-    print("Testing error handling...")
+    _vprint("Testing error handling...")
     
     engine = WipeEngine()
     
@@ -384,7 +378,7 @@ def test_error_handling():
         )
         # This should succeed because we create parent directories
         assert result.success is True
-        print("✓ Auto-creation of test files works")
+        _vprint("✓ Auto-creation of test files works")
         
         # Clean up created file
         if os.path.exists("/non/existent/path/device"):
@@ -393,9 +387,9 @@ def test_error_handling():
             os.rmdir("/non")
         
     except Exception as e:
-        print(f"✓ Error handling working: {e}")
+        _vprint(f"✓ Error handling working: {e}")
     
-    print("✓ Error handling tests passed")
+    _vprint("✓ Error handling tests passed")
 
 
 if __name__ == "__main__":
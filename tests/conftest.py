@@ -4,9 +4,8 @@ Pytest Configuration and Fixtures
 Common test fixtures and configuration for the secure data wiping system tests.
 """
 
+import copy
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
 import sqlite3
@@ -18,16 +17,21 @@ from secure_data_wiping.database.database_manager import DatabaseManager
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    temp_path = tempfile.mkdtemp()
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+def temp_dir(tmp_path_factory):
+    """Create a temporary directory for tests.
 
+    tmp_path_factory keeps all test dirs under one session root and
+    lets pytest batch cleanup (see tmp_path retention in pytest.ini),
+    replacing the per-test mkdtemp/rmtree cycle. Stays function-scoped
+    so tests that write fixed names like test.db remain isolated.
+    """
+    return str(tmp_path_factory.mktemp("sdw"))
 
-@pytest.fixture
-def test_config(temp_dir):
-    """Create a test configuration."""
+
+@pytest.fixture(scope="session")
+def test_config(tmp_path_factory):
+    """Create a test configuration (one per session; tests only read it)."""
+    base = tmp_path_factory.mktemp("sdw_config")
     return SystemConfig(
         ganache_url="http://127.0.0.1:7545",
         contract_address="0x1234567890123456789012345678901234567890",
@@ -35,30 +39,49 @@ def test_config(temp_dir):
         log_level="DEBUG",
         certificate_template="test",
         max_retry_attempts=2,
-        database_path=str(Path(temp_dir) / "test.db"),
-        certificates_dir=str(Path(temp_dir) / "certificates"),
-        logs_dir=str(Path(temp_dir) / "logs")
+        database_path=str(base / "test.db"),
+        certificates_dir=str(base / "certificates"),
+        logs_dir=str(base / "logs")
     )
 
 
-@pytest.fixture
-def config_manager(test_config, temp_dir):
+@pytest.fixture(scope="session")
+def config_manager(test_config, tmp_path_factory):
     """Create a test configuration manager."""
-    config_file = Path(temp_dir) / "test_config.yaml"
+    config_file = tmp_path_factory.mktemp("sdw_config_mgr") / "test_config.yaml"
     manager = ConfigManager(str(config_file))
     manager._config = test_config
     return manager
 
 
-@pytest.fixture
-def test_database(test_config):
-    """Create a test database."""
-    db_manager = DatabaseManager(test_config.database_path)
+# Data tables emptied between tests; system_config keeps its seeded
+# defaults from the schema.
+_DATA_TABLES = ("wipe_operations", "blockchain_records", "certificates")
+
+
+@pytest.fixture(scope="session")
+def _session_database():
+    """One in-memory database (and schema run) for the whole session."""
+    db_manager = DatabaseManager(":memory:")
     yield db_manager
-    # Cleanup is handled by temp_dir fixture
+    db_manager.close()
 
 
 @pytest.fixture
+def test_database(_session_database):
+    """Session database handed to each test, truncated afterwards.
+
+    DELETE FROM on an in-memory database is far cheaper than
+    re-running the schema per test, and preserves isolation.
+    """
+    yield _session_database
+    with _session_database.get_connection() as conn:
+        for table in _DATA_TABLES:
+            conn.execute(f"DELETE FROM {table}")
+        conn.commit()
+
+
+@pytest.fixture(scope="session")
 def sample_device_info():
     """Create sample device information for testing."""
     return DeviceInfo(
@@ -74,7 +97,7 @@ def sample_device_info():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_wipe_config():
     """Create sample wipe configuration for testing."""
     return WipeConfig(
@@ -87,9 +110,9 @@ def sample_wipe_config():
     )
 
 
-@pytest.fixture
-def mock_web3():
-    """Create a mock Web3 instance for blockchain testing."""
+@pytest.fixture(scope="session")
+def _mock_web3_template():
+    """Build the mock Web3 tree once per session; mock_web3 hands out clones."""
     mock_w3 = Mock()
     mock_w3.is_connected.return_value = True
     mock_w3.eth.chain_id = 1337  # Ganache default
@@ -122,6 +145,16 @@ def mock_web3():
 
 
 @pytest.fixture
+def mock_web3(_mock_web3_template):
+    """Per-test clone of the session Web3 mock.
+
+    deepcopy preserves the configured return values while keeping
+    each test free to reconfigure its copy.
+    """
+    return copy.deepcopy(_mock_web3_template)
+
+
+@pytest.fixture(scope="session")
 def mock_ganache_process():
     """Create a mock Ganache process for testing."""
     mock_process = Mock()
@@ -131,7 +164,7 @@ def mock_ganache_process():
     return mock_process
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_operation_data():
     """Create sample operation data for database testing."""
     return {
@@ -151,7 +184,7 @@ def sample_operation_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_blockchain_data():
     """Create sample blockchain data for testing."""
     return {
@@ -166,7 +199,7 @@ def sample_blockchain_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_certificate_data():
     """Create sample certificate data for testing."""
     return {
@@ -211,8 +244,8 @@ def positive_integer_strategy():
 
 
 # Test utilities
-def create_test_database_with_data(db_path: str, operations_count: int = 5):
-    """Create a test database with sample data."""
+def create_test_database_with_data(db_path: str = ":memory:", operations_count: int = 5):
+    """Create a test database with sample data (in-memory by default)."""
     db_manager = DatabaseManager(db_path)
     
     for i in range(operations_count):
@@ -251,26 +284,3 @@ def assert_valid_timestamp(timestamp_str: str):
         datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
     except ValueError:
         pytest.fail(f"Invalid timestamp format: {timestamp_str}")
-
-
-# Cleanup utilities
-@pytest.fixture(autouse=True)
-def cleanup_test_files():
-    """Automatically cleanup test files after each test."""
-    yield
-    # Cleanup any test files that might have been created
-    test_files = [
-        "test_*.db",
-        "test_*.log",
-        "test_*.pdf",
-        "test_*.yaml",
-        "test_*.json"
-    ]
-    
-    import glob
-    for pattern in test_files:
-        for file_path in glob.glob(pattern):
-            try:
-                Path(file_path).unlink(missing_ok=True)
-            except Exception:
-                pass  # Ignore cleanup errors
\ No newline at end of file
@@ -6,6 +6,7 @@ Tests the contract deployment process and verifies that the deployed
 contract functions correctly.
 """
 
+import copy
 import pytest
 import json
 import os
@@ -22,6 +23,47 @@ from scripts.start_ganache import GanacheManager
 from secure_data_wiping.utils.logging_config import get_component_logger
 
 
+def _make_web3_template():
+    """Build the mock Web3 tree once; tests get deepcopy clones."""
+    mock_web3 = Mock()
+    mock_web3.is_connected.return_value = True
+    mock_web3.eth.chain_id = 1337
+    mock_web3.eth.block_number = 1
+    mock_web3.eth.accounts = [
+        "0x742d35Cc6634C0532925a3b8D4C0C8b3C2e1e1e1",
+        "0x8ba1f109551bD432803012645Hac136c9.c3e1e1",
+        "0x123456789abcdef123456789abcdef123456789a"
+    ]
+    mock_web3.eth.default_account = mock_web3.eth.accounts[0]
+    mock_web3.eth.gas_price = 20000000000
+
+    # Mock transaction receipt
+    mock_tx_receipt = Mock()
+    mock_tx_receipt.status = 1
+    mock_tx_receipt.contractAddress = "0xContractAddress123456789abcdef"
+    mock_tx_receipt.blockNumber = 2
+    mock_tx_receipt.gasUsed = 2500000
+
+    mock_web3.eth.wait_for_transaction_receipt.return_value = mock_tx_receipt
+    return mock_web3
+
+
+_WEB3_TEMPLATE = _make_web3_template()
+
+
+@pytest.fixture(scope="session")
+def compiled_contract():
+    """Compile WipeAuditContract.sol once for the whole session.
+
+    Compilation output is deterministic for fixed source, so tests
+    share the (abi, bytecode) pair instead of invoking the compiler
+    per test.
+    """
+    deployer = ContractDeployer("http://localhost:8545")
+    assert deployer.compile_contract() is True
+    return deployer.contract_abi, deployer.contract_bytecode
+
+
 class TestContractDeployment:
     """
     Unit tests for smart contract deployment functionality.
@@ -36,28 +78,11 @@ class TestContractDeployment:
         """Set up test environment for each test method."""
         self.logger = get_component_logger('test_deployment')
         self.test_ganache_url = "http://localhost:8545"
-        
-        # Create mock Web3 instance
-        self.mock_web3 = Mock()
-        self.mock_web3.is_connected.return_value = True
-        self.mock_web3.eth.chain_id = 1337
-        self.mock_web3.eth.block_number = 1
-        self.mock_web3.eth.accounts = [
-            "0x742d35Cc6634C0532925a3b8D4C0C8b3C2e1e1e1",
-            "0x8ba1f109551bD432803012645Hac136c9.c3e1e1",
-            "0x123456789abcdef123456789abcdef123456789a"
-        ]
-        self.mock_web3.eth.default_account = self.mock_web3.eth.accounts[0]
-        self.mock_web3.eth.gas_price = 20000000000
-        
-        # Mock transaction receipt
-        self.mock_tx_receipt = Mock()
-        self.mock_tx_receipt.status = 1
-        self.mock_tx_receipt.contractAddress = "0xContractAddress123456789abcdef"
-        self.mock_tx_receipt.blockNumber = 2
-        self.mock_tx_receipt.gasUsed = 2500000
-        
-        self.mock_web3.eth.wait_for_transaction_receipt.return_value = self.mock_tx_receipt
+
+        # Clone the shared template; the copy is independent, so tests
+        # that reconfigure return values or accounts stay isolated
+        self.mock_web3 = copy.deepcopy(_WEB3_TEMPLATE)
+        self.mock_tx_receipt = self.mock_web3.eth.wait_for_transaction_receipt.return_value
     
     def test_contract_deployer_initialization(self):
         """Test ContractDeployer initialization."""
@@ -110,17 +135,16 @@ class TestContractDeployment:
         
         assert result is False
     
-    def test_compile_contract_success(self):
+    def test_compile_contract_success(self, compiled_contract):
         """Test successful contract compilation."""
-        deployer = ContractDeployer(self.test_ganache_url)
-        result = deployer.compile_contract()
-        
-        assert result is True
-        assert deployer.contract_abi is not None
-        assert deployer.contract_bytecode is not None
-        
+        # The session fixture already asserted compile_contract() succeeded
+        contract_abi, contract_bytecode = compiled_contract
+
+        assert contract_abi is not None
+        assert contract_bytecode is not None
+
         # Verify ABI contains expected functions
-        function_names = [item['name'] for item in deployer.contract_abi if item['type'] == 'function']
+        function_names = [item['name'] for item in contract_abi if item['type'] == 'function']
         expected_functions = [
             'recordWipe', 'getWipeRecord', 'verifyWipe', 'authorizeOperator',
             'isAuthorizedOperator', 'getOwner', 'getTotalRecords'
@@ -130,7 +154,7 @@ class TestContractDeployment:
             assert func_name in function_names, f"Function {func_name} not found in ABI"
     
     @patch('scripts.deploy_contract.Web3')
-    def test_deploy_contract_success(self, mock_web3_class):
+    def test_deploy_contract_success(self, mock_web3_class, compiled_contract):
         """Test successful contract deployment."""
         # Setup mocks
         mock_web3_class.return_value = self.mock_web3
@@ -146,7 +170,7 @@ class TestContractDeployment:
         # Test deployment
         deployer = ContractDeployer(self.test_ganache_url)
         deployer.connect_to_ganache()
-        deployer.compile_contract()
+        deployer.contract_abi, deployer.contract_bytecode = compiled_contract
         
         result = deployer.deploy_contract()
         
@@ -156,7 +180,7 @@ class TestContractDeployment:
         assert deployer.deployment_tx_hash == "0xTransactionHash123"
     
     @patch('scripts.deploy_contract.Web3')
-    def test_deploy_contract_failure(self, mock_web3_class):
+    def test_deploy_contract_failure(self, mock_web3_class, compiled_contract):
         """Test contract deployment failure."""
         # Setup mocks for failure
         mock_web3_class.return_value = self.mock_web3
@@ -175,14 +199,14 @@ class TestContractDeployment:
         # Test deployment
         deployer = ContractDeployer(self.test_ganache_url)
         deployer.connect_to_ganache()
-        deployer.compile_contract()
+        deployer.contract_abi, deployer.contract_bytecode = compiled_contract
         
         result = deployer.deploy_contract()
         
         assert result is False
     
     @patch('scripts.deploy_contract.Web3')
-    def test_verify_deployment_success(self, mock_web3_class):
+    def test_verify_deployment_success(self, mock_web3_class, compiled_contract):
         """Test successful deployment verification."""
         # Setup mocks
         mock_web3_class.return_value = self.mock_web3
@@ -200,7 +224,7 @@ class TestContractDeployment:
         # Test verification
         deployer = ContractDeployer(self.test_ganache_url)
         deployer.connect_to_ganache()
-        deployer.compile_contract()
+        deployer.contract_abi, deployer.contract_bytecode = compiled_contract
         deployer.contract_address = "0xTestContract"
         
         result = deployer.verify_deployment()
@@ -208,7 +232,7 @@ class TestContractDeployment:
         assert result is True
     
     @patch('scripts.deploy_contract.Web3')
-    def test_verify_deployment_failure(self, mock_web3_class):
+    def test_verify_deployment_failure(self, mock_web3_class, compiled_contract):
         """Test deployment verification failure."""
         # Setup mocks for failure
         mock_web3_class.return_value = self.mock_web3
@@ -221,7 +245,7 @@ class TestContractDeployment:
         # Test verification
         deployer = ContractDeployer(self.test_ganache_url)
         deployer.connect_to_ganache()
-        deployer.compile_contract()
+        deployer.contract_abi, deployer.contract_bytecode = compiled_contract
         deployer.contract_address = "0xTestContract"
         
         result = deployer.verify_deployment()
@@ -231,7 +255,7 @@ class TestContractDeployment:
     @patch('scripts.deploy_contract.Web3')
     @patch('builtins.open', create=True)
     @patch('json.dump')
-    def test_generate_config_files_success(self, mock_json_dump, mock_open, mock_web3_class):
+    def test_generate_config_files_success(self, mock_json_dump, mock_open, mock_web3_class, compiled_contract):
         """Test successful configuration file generation."""
         # Setup mocks
         mock_web3_class.return_value = self.mock_web3
@@ -241,7 +265,7 @@ class TestContractDeployment:
         # Test config generation
         deployer = ContractDeployer(self.test_ganache_url)
         deployer.connect_to_ganache()
-        deployer.compile_contract()
+        deployer.contract_abi, deployer.contract_bytecode = compiled_contract
         deployer.contract_address = "0xTestContract"
         deployer.deployment_tx_hash = "0xTestTx"
         deployer.deployment_block = 2
@@ -295,6 +295,10 @@ class TestSmartContractDataIntegrity:
         self.logger = get_component_logger('test_contract_integrity')
         self.mock_contract = Mock()
         self.stored_records = {}
+        # Membership set for interned device ids; lets the immutability
+        # check gate on a pointer-compare lookup before touching the
+        # record dict itself.
+        self.seen_ids = set()
     
     def mock_keccak(self, data):
         """Mock Web3.keccak function for testing."""